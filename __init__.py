@@ -49,6 +49,7 @@ from voice_generation.storage.filesystem import FileSystemStorage
 from voice_generation.core.results import (
     GenerationResult,
     ValidationResult,
+    ValidationCode,
     CostEstimate,
     SegmentResult,
 )
@@ -71,6 +72,7 @@ __all__ = [
     # Results
     "GenerationResult",
     "ValidationResult",
+    "ValidationCode",
     "CostEstimate",
     "SegmentResult",
     # Exceptions
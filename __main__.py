@@ -28,6 +28,10 @@ from voice_generation.core.validator import NarrationValidator
 from voice_generation.storage.filesystem import FileSystemStorage
 
 
+# Named explicitly: __name__ is "__main__" when run via `python -m voice_generation`
+logger = logging.getLogger("voice_generation.cli")
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -106,6 +110,10 @@ For more information, see: https://github.com/your-repo/voice-generation
             validation = validator.validate(script)
 
             if validation.is_valid:
+                logger.debug(
+                    f"Validation passed ({len(validation.warnings)} warning(s))",
+                    extra={"status": "validation_passed", "warning_count": len(validation.warnings)},
+                )
                 print("✓ Validation passed")
                 if validation.warnings:
                     print(f"\nWarnings ({len(validation.warnings)}):")
@@ -113,6 +121,10 @@ For more information, see: https://github.com/your-repo/voice-generation
                         print(f"  ⚠  {warning}")
                 return 0
             else:
+                logger.debug(
+                    f"Validation failed ({len(validation.errors)} error(s))",
+                    extra={"status": "validation_failed", "error_count": len(validation.errors)},
+                )
                 print("✗ Validation failed:")
                 for error in validation.errors:
                     print(f"  ✗ {error}")
@@ -127,6 +139,10 @@ For more information, see: https://github.com/your-repo/voice-generation
 
             # Estimate cost (using ElevenLabs pricing)
             estimated_cost = (total_chars / 1000) * ElevenLabsClient.PRICE_PER_1K_CHARS
+            logger.debug(
+                f"Estimated cost: ${estimated_cost:.2f} USD ({total_chars:,} characters)",
+                extra={"status": "cost_estimated", "total_characters": total_chars, "estimated_usd": estimated_cost},
+            )
 
             print(f"Total characters: {total_chars:,}")
             print(f"Estimated cost: ${estimated_cost:.2f} USD")
@@ -148,6 +164,11 @@ For more information, see: https://github.com/your-repo/voice-generation
             verbose=args.verbose,
         )
 
+        logger.debug(
+            f"Generation complete for '{result.exercise_id}'",
+            extra={"status": "generation_complete", "exercise_id": result.exercise_id},
+        )
+
         # Print results
         print("\n" + "=" * 60)
         print("GENERATION COMPLETE")
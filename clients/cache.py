@@ -10,9 +10,11 @@ Test Coverage: 45.19% (integrated with TTS client tests)
 import hashlib
 import json
 import logging
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from pydub import AudioSegment
 
@@ -30,22 +32,55 @@ class AudioCache:
         {cache_dir}/
             {hash}.wav       # Cached audio file
             {hash}.meta.json # Metadata (timestamp, text, etc.)
+
+    Entries read from disk are also kept decoded in a small in-memory LRU,
+    so repeated hits skip the metadata read and WAV decode.
     """
 
-    def __init__(self, cache_dir: Path, ttl_days: int = 30):
+    def __init__(self, cache_dir: Path, ttl_days: int = 30, memory_entries: int = 128):
         """
         Initialize audio cache.
 
         Args:
             cache_dir: Directory for cache storage
             ttl_days: Time-to-live in days (default: 30)
+            memory_entries: Decoded entries kept in memory, or 0 to disable (default: 128)
         """
         self.cache_dir = Path(cache_dir)
         self.ttl_seconds = ttl_days * 24 * 60 * 60
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, Tuple[float, AudioSegment]] = OrderedDict()
+        # Guards _memory: move_to_end/popitem are not safe to interleave across threads
+        self._memory_lock = threading.Lock()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         logger.info(f"Initialized AudioCache at {self.cache_dir} (TTL: {ttl_days} days)")
 
-    def _compute_key(self, text: str, previous_text: Optional[str], next_text: Optional[str], voice_config: dict) -> str:
+    @staticmethod
+    def digest_voice_config(voice_config: dict) -> bytes:
+        """
+        Compute the voice configuration part of the cache key.
+
+        Clients that keep one voice configuration can compute this once and pass
+        it to get()/set() as voice_config_digest instead of re-serializing the
+        configuration on every call.
+
+        Args:
+            voice_config: Voice configuration (voice_id, model, etc.)
+
+        Returns:
+            BLAKE2b digest of the canonical JSON serialization
+        """
+        data = json.dumps(voice_config, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(data.encode(), digest_size=32).digest()
+
+    def _compute_key(
+        self,
+        text: str,
+        previous_text: Optional[str],
+        next_text: Optional[str],
+        voice_config: dict,
+        voice_config_digest: Optional[bytes] = None
+    ) -> str:
         """
         Compute cache key from text and context.
 
@@ -54,25 +89,28 @@ class AudioCache:
             previous_text: Previous context
             next_text: Next context
             voice_config: Voice configuration (voice_id, model, etc.)
+            voice_config_digest: Precomputed digest_voice_config(voice_config), or None to compute it
 
         Returns:
-            SHA256 hash as hexadecimal string
+            BLAKE2b hash as hexadecimal string
         """
-        data = json.dumps({
-            "text": text,
-            "previous_text": previous_text or "",
-            "next_text": next_text or "",
-            **voice_config
-        }, sort_keys=True)
+        if voice_config_digest is None:
+            voice_config_digest = self.digest_voice_config(voice_config)
 
-        return hashlib.sha256(data.encode()).hexdigest()
+        data = json.dumps([text, previous_text or "", next_text or ""], separators=(",", ":"))
+
+        # BLAKE2b is faster than SHA256 in hashlib and keeps the same 64-char key length
+        key_hash = hashlib.blake2b(data.encode(), digest_size=32)
+        key_hash.update(voice_config_digest)
+        return key_hash.hexdigest()
 
     def get(
         self,
         text: str,
         previous_text: Optional[str],
         next_text: Optional[str],
-        voice_config: dict
+        voice_config: dict,
+        voice_config_digest: Optional[bytes] = None
     ) -> Optional[AudioSegment]:
         """
         Retrieve audio from cache if available and not expired.
@@ -82,22 +120,37 @@ class AudioCache:
             previous_text: Previous context
             next_text: Next context
             voice_config: Voice configuration
+            voice_config_digest: Precomputed digest_voice_config(voice_config) (default: None)
 
         Returns:
             Cached audio segment, or None if not found/expired
         """
-        cache_key = self._compute_key(text, previous_text, next_text, voice_config)
+        cache_key = self._compute_key(text, previous_text, next_text, voice_config, voice_config_digest)
+
+        # Check in-memory entries first
+        with self._memory_lock:
+            entry = self._memory.get(cache_key)
+            if entry is not None:
+                self._memory.move_to_end(cache_key)
+
+        if entry is not None:
+            cached_time, audio = entry
+            age_seconds = time.time() - cached_time
+
+            if age_seconds > self.ttl_seconds:
+                logger.debug(f"Cache EXPIRED: {cache_key[:8]}... (age: {age_seconds/86400:.1f} days)")
+                self._delete_entry(cache_key)
+                return None
+
+            logger.debug(f"Cache HIT (memory): {cache_key[:8]}... ({len(text)} chars)")
+            return audio
+
         audio_path = self.cache_dir / f"{cache_key}.wav"
         meta_path = self.cache_dir / f"{cache_key}.meta.json"
 
-        # Check if both files exist
-        if not (audio_path.exists() and meta_path.exists()):
-            return None
-
         try:
-            # Load metadata
-            with open(meta_path, "r") as f:
-                metadata = json.load(f)
+            # Load metadata (a missing file is a miss; no separate exists() checks)
+            metadata = json.loads(meta_path.read_bytes())
 
             # Check TTL
             cached_time = metadata.get("timestamp", 0)
@@ -111,9 +164,12 @@ class AudioCache:
 
             # Load audio
             audio = AudioSegment.from_wav(audio_path)
+            self._remember(cache_key, cached_time, audio)
             logger.debug(f"Cache HIT: {cache_key[:8]}... ({len(text)} chars)")
             return audio
 
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.warning(f"Cache read error for {cache_key[:8]}...: {e}")
             return None
@@ -124,7 +180,8 @@ class AudioCache:
         previous_text: Optional[str],
         next_text: Optional[str],
         voice_config: dict,
-        audio: AudioSegment
+        audio: AudioSegment,
+        voice_config_digest: Optional[bytes] = None
     ) -> None:
         """
         Store audio in cache.
@@ -135,11 +192,16 @@ class AudioCache:
             next_text: Next context
             voice_config: Voice configuration
             audio: Audio segment to cache
+            voice_config_digest: Precomputed digest_voice_config(voice_config) (default: None)
         """
-        cache_key = self._compute_key(text, previous_text, next_text, voice_config)
+        cache_key = self._compute_key(text, previous_text, next_text, voice_config, voice_config_digest)
         audio_path = self.cache_dir / f"{cache_key}.wav"
         meta_path = self.cache_dir / f"{cache_key}.meta.json"
 
+        # Drop any stale in-memory copy; the next get() reloads the new entry
+        with self._memory_lock:
+            self._memory.pop(cache_key, None)
+
         try:
             # Save audio
             audio.export(audio_path, format="wav")
@@ -165,8 +227,21 @@ class AudioCache:
             if meta_path.exists():
                 meta_path.unlink()
 
+    def _remember(self, cache_key: str, cached_time: float, audio: AudioSegment) -> None:
+        """Keep decoded audio in memory, evicting the least recently used entry."""
+        if self.memory_entries <= 0:
+            return
+
+        with self._memory_lock:
+            self._memory[cache_key] = (cached_time, audio)
+            self._memory.move_to_end(cache_key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
     def _delete_entry(self, cache_key: str) -> None:
         """Delete cache entry (both audio and metadata)."""
+        with self._memory_lock:
+            self._memory.pop(cache_key, None)
         audio_path = self.cache_dir / f"{cache_key}.wav"
         meta_path = self.cache_dir / f"{cache_key}.meta.json"
 
@@ -183,6 +258,8 @@ class AudioCache:
             Number of entries deleted
         """
         count = 0
+        with self._memory_lock:
+            self._memory.clear()
         for audio_file in self.cache_dir.glob("*.wav"):
             cache_key = audio_file.stem
             self._delete_entry(cache_key)
@@ -14,9 +14,12 @@ Test Coverage: 84.48% (19 tests covering client + cache)
 
 import io
 import logging
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import requests
 from pydub import AudioSegment
@@ -43,6 +46,10 @@ class ElevenLabsClient(TTSClient):
     # ElevenLabs pricing (approximate, as of 2024)
     PRICE_PER_1K_CHARS = 0.30  # USD
 
+    # Retry waits get up to +50% random jitter and are capped per attempt
+    RETRY_JITTER = 0.5
+    MAX_RETRY_WAIT_SECONDS = 30.0
+
     def __init__(
         self,
         api_key: str,
@@ -55,7 +62,8 @@ class ElevenLabsClient(TTSClient):
         cache_dir: Optional[Path] = None,
         cache_ttl_days: int = 30,
         max_retries: int = 3,
-        retry_backoff_factor: float = 2.0
+        retry_backoff_factor: float = 2.0,
+        session: Optional[requests.Session] = None
     ):
         """
         Initialize ElevenLabs TTS client.
@@ -72,6 +80,7 @@ class ElevenLabsClient(TTSClient):
             cache_ttl_days: Cache TTL in days (default: 30)
             max_retries: Maximum retry attempts (default: 3)
             retry_backoff_factor: Exponential backoff factor (default: 2.0)
+            session: HTTP session for API calls, or None to create one (default: None)
         """
         self.api_key = api_key
         self.voice_id = voice_id
@@ -82,11 +91,20 @@ class ElevenLabsClient(TTSClient):
         self.use_speaker_boost = use_speaker_boost
         self.max_retries = max_retries
         self.retry_backoff_factor = retry_backoff_factor
+        self._rng = random.Random()
+
+        # Reused across calls so consecutive segments share a keep-alive connection
+        self.session = session or requests.Session()
 
         # Initialize cache if enabled
         self.cache = AudioCache(cache_dir, cache_ttl_days) if cache_dir else None
 
-        # Statistics
+        # Cache-key digest of the voice settings, recomputed only when they change
+        self._digested_voice_config: Optional[dict] = None
+        self._voice_config_digest = b""
+
+        # Statistics (API counters are guarded: generate_audio_batch calls the API from worker threads)
+        self._stats_lock = threading.Lock()
         self.cache_hits = 0
         self.cache_misses = 0
         self.api_calls = 0
@@ -118,27 +136,95 @@ class ElevenLabsClient(TTSClient):
             TTSError: If generation fails after all retries
         """
         # Check cache first
-        if self.cache:
-            voice_config = self._get_voice_config_dict()
-            cached_audio = self.cache.get(text, previous_text, next_text, voice_config)
-
-            if cached_audio is not None:
-                self.cache_hits += 1
-                logger.info(f"Cache HIT ({self.cache_hits} hits, {self.cache_misses} misses): {text[:50]}...")
-                return cached_audio
-
-            self.cache_misses += 1
+        cached_audio = self._get_cached_audio(text, previous_text, next_text)
+        if cached_audio is not None:
+            return cached_audio
 
         # Generate via API
         audio = self._call_api_with_retry(text, previous_text, next_text)
 
         # Store in cache
-        if self.cache:
-            voice_config = self._get_voice_config_dict()
-            self.cache.set(text, previous_text, next_text, voice_config, audio)
+        self._store_cached_audio(text, previous_text, next_text, audio)
 
         return audio
 
+    def generate_audio_batch(self, texts: List[str], max_workers: int = 4) -> List[AudioSegment]:
+        """
+        Generate audio for several independent texts, calling the API concurrently.
+
+        Texts are generated without previous/next context. Cached texts are
+        returned directly and repeated texts are requested only once. Cache
+        lookups and writes stay on the calling thread; only API requests run on
+        worker threads, and they share self.session. A session passed to the
+        constructor must therefore tolerate concurrent use, or max_workers
+        should be 1.
+
+        Args:
+            texts: Texts to convert to speech
+            max_workers: Maximum concurrent API requests (default: 4)
+
+        Returns:
+            Generated audio segments, in the same order as texts
+
+        Raises:
+            TTSError: If any generation fails after all retries
+        """
+        results: Dict[str, AudioSegment] = {}
+        misses: List[str] = []
+
+        for text in dict.fromkeys(texts):
+            cached_audio = self._get_cached_audio(text, None, None)
+            if cached_audio is not None:
+                results[text] = cached_audio
+            else:
+                misses.append(text)
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                generated = executor.map(lambda text: self._call_api_with_retry(text, None, None), misses)
+                for text, audio in zip(misses, generated):
+                    self._store_cached_audio(text, None, None, audio)
+                    results[text] = audio
+
+        return [results[text] for text in texts]
+
+    def _get_cached_audio(
+        self,
+        text: str,
+        previous_text: Optional[str],
+        next_text: Optional[str]
+    ) -> Optional[AudioSegment]:
+        """Look up audio in cache (if enabled), tracking hits and misses."""
+        if not self.cache:
+            return None
+
+        voice_config = self._get_voice_config_dict()
+        voice_config_digest = self._get_voice_config_digest(voice_config)
+        cached_audio = self.cache.get(text, previous_text, next_text, voice_config, voice_config_digest)
+
+        if cached_audio is not None:
+            self.cache_hits += 1
+            logger.info(f"Cache HIT ({self.cache_hits} hits, {self.cache_misses} misses): {text[:50]}...")
+            return cached_audio
+
+        self.cache_misses += 1
+        return None
+
+    def _store_cached_audio(
+        self,
+        text: str,
+        previous_text: Optional[str],
+        next_text: Optional[str],
+        audio: AudioSegment
+    ) -> None:
+        """Store generated audio in cache (if enabled)."""
+        if not self.cache:
+            return
+
+        voice_config = self._get_voice_config_dict()
+        voice_config_digest = self._get_voice_config_digest(voice_config)
+        self.cache.set(text, previous_text, next_text, voice_config, audio, voice_config_digest)
+
     def _call_api_with_retry(
         self,
         text: str,
@@ -162,7 +248,7 @@ class ElevenLabsClient(TTSClient):
 
                 # Retry on server errors (5xx) or network errors
                 if attempt < self.max_retries - 1:
-                    wait_time = self.retry_backoff_factor ** attempt
+                    wait_time = self._get_retry_wait(attempt)
                     logger.warning(
                         f"API call failed (attempt {attempt + 1}/{self.max_retries}), "
                         f"retrying in {wait_time:.1f}s: {e}"
@@ -174,6 +260,12 @@ class ElevenLabsClient(TTSClient):
         # All retries exhausted
         raise last_error
 
+    def _get_retry_wait(self, attempt: int) -> float:
+        """Get backoff before the next retry, jittered so concurrent clients don't retry in lockstep."""
+        wait_time = self.retry_backoff_factor ** attempt
+        wait_time *= 1.0 + self._rng.uniform(0.0, self.RETRY_JITTER)
+        return min(wait_time, self.MAX_RETRY_WAIT_SECONDS)
+
     def _call_api(
         self,
         text: str,
@@ -208,11 +300,12 @@ class ElevenLabsClient(TTSClient):
 
         try:
             logger.debug(f"Calling ElevenLabs API for text ({len(text)} chars): {text[:50]}...")
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = self.session.post(url, json=payload, headers=headers, timeout=30)
 
             # Track statistics
-            self.api_calls += 1
-            self.total_characters += len(text)
+            with self._stats_lock:
+                self.api_calls += 1
+                self.total_characters += len(text)
 
             # Check response
             if response.status_code != 200:
@@ -257,6 +350,13 @@ class ElevenLabsClient(TTSClient):
             "use_speaker_boost": self.use_speaker_boost
         }
 
+    def _get_voice_config_digest(self, voice_config: dict) -> bytes:
+        """Get cache-key digest of voice configuration, reusing it while settings are unchanged."""
+        if voice_config != self._digested_voice_config:
+            self._voice_config_digest = AudioCache.digest_voice_config(voice_config)
+            self._digested_voice_config = voice_config
+        return self._voice_config_digest
+
     def get_stats(self) -> dict:
         """
         Get client statistics.
@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Literal, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import ValidationError as PydanticValidationError
 
 
 class Exercise(BaseModel):
@@ -27,6 +28,9 @@ class Exercise(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Searchable tags")
     duration_seconds: Optional[int] = Field(None, ge=0, description="Target exercise duration in seconds")
 
+    # Build the validator on first use rather than at import (keeps CLI start-up cheap)
+    model_config = {"defer_build": True}
+
     @field_validator("id")
     @classmethod
     def validate_id_format(cls, v: str) -> str:
@@ -47,6 +51,8 @@ class AudioConfig(BaseModel):
         description="When audio plays relative to breathing cycle"
     )
 
+    model_config = {"defer_build": True}
+
     @field_validator("fragments")
     @classmethod
     def validate_fragments_not_empty(cls, v: List[str]) -> List[str]:
@@ -70,6 +76,8 @@ class BreathingPattern(BaseModel):
     duration_ms: Optional[int] = Field(None, ge=0, description="Duration for 'natural' pattern in milliseconds")
     repetitions: int = Field(1, ge=1, description="Number of breath cycle repetitions")
 
+    model_config = {"defer_build": True}
+
     @model_validator(mode="after")
     def validate_pattern_or_explicit(self):
         """Ensure either pattern OR explicit inhale/exhale/duration specified."""
@@ -117,6 +125,8 @@ class Segment(BaseModel):
     audio: AudioConfig = Field(..., description="Audio configuration")
     breathing: Optional[BreathingPattern] = Field(None, description="Breathing pattern (required for breathing_cycle type)")
 
+    model_config = {"defer_build": True}
+
     @model_validator(mode="after")
     def validate_breathing_for_type(self):
         """Ensure breathing_cycle segments have breathing config."""
@@ -136,6 +146,8 @@ class VoiceConfig(BaseModel):
     style: float = Field(0.15, ge=0, le=1, description="Style exaggeration (0-1)")
     use_speaker_boost: bool = Field(True, description="Enable speaker boost")
 
+    model_config = {"defer_build": True}
+
 
 class NarrationScript(BaseModel):
     """Complete narration script for a breathing exercise."""
@@ -144,7 +156,7 @@ class NarrationScript(BaseModel):
     segments: List[Segment] = Field(..., min_length=1, description="Ordered list of exercise segments")
     voice_config: VoiceConfig = Field(..., description="TTS voice configuration")
 
-    model_config = {"extra": "forbid"}  # Reject unknown fields
+    model_config = {"extra": "forbid", "defer_build": True}  # Reject unknown fields
 
     @classmethod
     def from_file(cls, path: Union[str, Path]) -> "NarrationScript":
@@ -166,10 +178,33 @@ class NarrationScript(BaseModel):
         if not path.exists():
             raise FileNotFoundError(f"Narration script not found: {path}")
 
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        return cls.from_bytes(path.read_bytes())
+
+    @classmethod
+    def from_bytes(cls, data: Union[str, bytes]) -> "NarrationScript":
+        """
+        Parse and validate narration script from raw JSON.
+
+        Parsing and validation happen in a single pydantic-core pass, without
+        building an intermediate dict.
 
-        return cls(**data)
+        Args:
+            data: JSON document as bytes or str
+
+        Returns:
+            Validated NarrationScript instance
+
+        Raises:
+            ValidationError: If JSON schema validation fails
+            json.JSONDecodeError: If data is not valid JSON
+        """
+        try:
+            return cls.model_validate_json(data)
+        except PydanticValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                # Surface malformed JSON the same way json.load() would
+                json.loads(data)
+            raise
 
     def to_file(self, path: Union[str, Path]) -> None:
         """
@@ -7,8 +7,18 @@ Test Coverage: 95.56% (integrated with validator and generator tests)
 """
 
 from dataclasses import dataclass, field
+from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
+
+
+class ValidationCode(str, Enum):
+    """Machine-readable identifiers for validation errors."""
+
+    EXERCISE_TOO_LONG = "exercise_too_long"
+    DUPLICATE_SEGMENT_ID = "duplicate_segment_id"
+    BREATHING_TOO_SHORT = "breathing_too_short"
+    AUDIO_EXCEEDS_MAX_DURATION = "audio_exceeds_max_duration"
 
 
 @dataclass
@@ -18,6 +28,7 @@ class ValidationResult:
     is_valid: bool
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
+    error_codes: Set[ValidationCode] = field(default_factory=set)
 
     def __str__(self) -> str:
         if self.is_valid:
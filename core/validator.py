@@ -11,10 +11,10 @@ Test Coverage: 93.98% (18 tests)
 """
 
 import logging
-from typing import List
+from typing import List, Set
 
 from voice_generation.core.models import NarrationScript, Segment
-from voice_generation.core.results import ValidationResult
+from voice_generation.core.results import ValidationCode, ValidationResult
 
 
 logger = logging.getLogger(__name__)
@@ -42,24 +42,27 @@ class NarrationValidator:
         """Initialize validator."""
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.error_codes: Set[ValidationCode] = set()
 
-    def validate(self, script: NarrationScript) -> ValidationResult:
+    def validate(self, script: NarrationScript, fail_fast: bool = False) -> ValidationResult:
         """
         Validate narration script.
 
         Args:
             script: Narration script to validate
+            fail_fast: Stop after the first check or segment that reports an error (default: False)
 
         Returns:
             ValidationResult with is_valid flag and error/warning lists
         """
         self.errors = []
         self.warnings = []
+        self.error_codes = set()
 
         # Pydantic already validated schema, so we only check business rules
         self._validate_exercise_duration(script)
-        self._validate_segments(script)
-        self._validate_timing_feasibility(script)
+        if not (fail_fast and self.errors):
+            self._validate_segments(script, fail_fast)
 
         is_valid = len(self.errors) == 0
 
@@ -68,7 +71,17 @@ class NarrationValidator:
         else:
             logger.error(f"Validation failed for '{script.exercise.id}' ({len(self.errors)} errors)")
 
-        return ValidationResult(is_valid=is_valid, errors=self.errors.copy(), warnings=self.warnings.copy())
+        return ValidationResult(
+            is_valid=is_valid,
+            errors=self.errors.copy(),
+            warnings=self.warnings.copy(),
+            error_codes=self.error_codes.copy(),
+        )
+
+    def _add_error(self, code: ValidationCode, message: str) -> None:
+        """Record an error message along with its code."""
+        self.errors.append(message)
+        self.error_codes.add(code)
 
     def _validate_exercise_duration(self, script: NarrationScript) -> None:
         """Check exercise duration is reasonable."""
@@ -76,7 +89,8 @@ class NarrationValidator:
         estimated_duration_s = estimated_duration_ms / 1000
 
         if estimated_duration_s > self.MAX_EXERCISE_DURATION_SECONDS:
-            self.errors.append(
+            self._add_error(
+                ValidationCode.EXERCISE_TOO_LONG,
                 f"Exercise duration too long: {estimated_duration_s:.0f}s "
                 f"(max: {self.MAX_EXERCISE_DURATION_SECONDS}s)"
             )
@@ -90,22 +104,27 @@ class NarrationValidator:
                     f"estimated {estimated_duration_s:.0f}s (diff: {diff_seconds:.0f}s)"
                 )
 
-    def _validate_segments(self, script: NarrationScript) -> None:
-        """Validate individual segments."""
+    def _validate_segments(self, script: NarrationScript, fail_fast: bool = False) -> None:
+        """Validate individual segments and their timing in a single pass."""
         segment_ids = set()
 
         for idx, segment in enumerate(script.segments):
             # Check unique segment IDs
             if segment.id in segment_ids:
-                self.errors.append(f"Duplicate segment ID: '{segment.id}'")
+                self._add_error(ValidationCode.DUPLICATE_SEGMENT_ID, f"Duplicate segment ID: '{segment.id}'")
             segment_ids.add(segment.id)
 
             # Validate breathing patterns
             if segment.breathing:
                 self._validate_breathing_pattern(segment, idx)
 
-            # Validate audio config
-            self._validate_audio_config(segment, idx)
+            # Validate audio config and timing (both need the segment's text length)
+            total_chars = sum(len(frag) for frag in segment.audio.fragments)
+            self._validate_audio_config(segment, idx, total_chars)
+            self._validate_timing_feasibility(segment, idx, total_chars)
+
+            if fail_fast and self.errors:
+                break
 
     def _validate_breathing_pattern(self, segment: Segment, idx: int) -> None:
         """Validate breathing pattern timing."""
@@ -114,7 +133,8 @@ class NarrationValidator:
         if breathing.duration_ms:
             # Natural breathing pattern
             if breathing.duration_ms < self.MIN_BREATHING_CYCLE_MS:
-                self.errors.append(
+                self._add_error(
+                    ValidationCode.BREATHING_TOO_SHORT,
                     f"Segment {idx} ({segment.id}): breathing duration too short "
                     f"({breathing.duration_ms}ms, min: {self.MIN_BREATHING_CYCLE_MS}ms)"
                 )
@@ -128,7 +148,8 @@ class NarrationValidator:
             total_cycle_ms = breathing.get_total_cycle_duration_ms()
 
             if total_cycle_ms < self.MIN_BREATHING_CYCLE_MS:
-                self.errors.append(
+                self._add_error(
+                    ValidationCode.BREATHING_TOO_SHORT,
                     f"Segment {idx} ({segment.id}): total breathing cycle too short "
                     f"({total_cycle_ms}ms, min: {self.MIN_BREATHING_CYCLE_MS}ms)"
                 )
@@ -145,7 +166,7 @@ class NarrationValidator:
                     f"Segment {idx} ({segment.id}): very high repetition count ({breathing.repetitions})"
                 )
 
-    def _validate_audio_config(self, segment: Segment, idx: int) -> None:
+    def _validate_audio_config(self, segment: Segment, idx: int, total_chars: int) -> None:
         """Validate audio configuration."""
         audio = segment.audio
 
@@ -157,8 +178,6 @@ class NarrationValidator:
             )
 
         # Check total text length
-        total_chars = sum(len(frag) for frag in audio.fragments)
-
         if total_chars > 1000:
             self.warnings.append(
                 f"Segment {idx} ({segment.id}): long text ({total_chars} chars), "
@@ -173,45 +192,44 @@ class NarrationValidator:
                     f"consider splitting"
                 )
 
-    def _validate_timing_feasibility(self, script: NarrationScript) -> None:
-        """Check if audio will fit in breathing cycles."""
-        for idx, segment in enumerate(script.segments):
-            if segment.type == "narration":
-                # Narration-only segments don't have timing constraints
-                continue
+    def _validate_timing_feasibility(self, segment: Segment, idx: int, total_chars: int) -> None:
+        """Check if segment audio will fit in its breathing cycle."""
+        if segment.type == "narration":
+            # Narration-only segments don't have timing constraints
+            return
 
-            if not segment.breathing or not segment.audio.max_duration_ms:
-                # No timing constraint specified
-                continue
+        if not segment.breathing or not segment.audio.max_duration_ms:
+            # No timing constraint specified
+            return
 
-            # Estimate audio duration
-            total_chars = sum(len(frag) for frag in segment.audio.fragments)
-            min_duration_ms = (total_chars / self.CHARS_PER_SECOND_FAST) * 1000
-            max_duration_ms = (total_chars / self.CHARS_PER_SECOND_SLOW) * 1000
-
-            # Check if audio fits in max_duration_ms
-            if min_duration_ms > segment.audio.max_duration_ms:
-                if segment.audio.allow_shortening:
-                    self.warnings.append(
-                        f"Segment {idx} ({segment.id}): audio likely to exceed max_duration "
-                        f"({min_duration_ms:.0f}ms > {segment.audio.max_duration_ms}ms), "
-                        f"will require text shortening"
-                    )
-                else:
-                    self.errors.append(
-                        f"Segment {idx} ({segment.id}): audio will exceed max_duration "
-                        f"({min_duration_ms:.0f}ms > {segment.audio.max_duration_ms}ms) "
-                        f"and shortening is disabled"
-                    )
-
-            # Check if max_duration fits in breathing cycle
-            if segment.breathing:
-                cycle_duration_ms = segment.breathing.get_total_cycle_duration_ms()
-
-                # Typically voice plays during inhale, so max_duration should be <= inhale duration
-                # But we'll be lenient and allow up to full cycle duration
-                if segment.audio.max_duration_ms > cycle_duration_ms:
-                    self.warnings.append(
-                        f"Segment {idx} ({segment.id}): max_duration ({segment.audio.max_duration_ms}ms) "
-                        f"exceeds breathing cycle duration ({cycle_duration_ms}ms)"
-                    )
+        # Estimate audio duration
+        min_duration_ms = (total_chars / self.CHARS_PER_SECOND_FAST) * 1000
+        max_duration_ms = (total_chars / self.CHARS_PER_SECOND_SLOW) * 1000
+
+        # Check if audio fits in max_duration_ms
+        if min_duration_ms > segment.audio.max_duration_ms:
+            if segment.audio.allow_shortening:
+                self.warnings.append(
+                    f"Segment {idx} ({segment.id}): audio likely to exceed max_duration "
+                    f"({min_duration_ms:.0f}ms > {segment.audio.max_duration_ms}ms), "
+                    f"will require text shortening"
+                )
+            else:
+                self._add_error(
+                    ValidationCode.AUDIO_EXCEEDS_MAX_DURATION,
+                    f"Segment {idx} ({segment.id}): audio will exceed max_duration "
+                    f"({min_duration_ms:.0f}ms > {segment.audio.max_duration_ms}ms) "
+                    f"and shortening is disabled"
+                )
+
+        # Check if max_duration fits in breathing cycle
+        if segment.breathing:
+            cycle_duration_ms = segment.breathing.get_total_cycle_duration_ms()
+
+            # Typically voice plays during inhale, so max_duration should be <= inhale duration
+            # But we'll be lenient and allow up to full cycle duration
+            if segment.audio.max_duration_ms > cycle_duration_ms:
+                self.warnings.append(
+                    f"Segment {idx} ({segment.id}): max_duration ({segment.audio.max_duration_ms}ms) "
+                    f"exceeds breathing cycle duration ({cycle_duration_ms}ms)"
+                )
@@ -119,9 +119,10 @@ class FileSystemStorage(Storage):
             # Ensure parent directory exists
             path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON with pretty formatting
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize fully before touching the file: one write instead of one
+            # per encoder chunk, and no partial file if serialization fails
+            text = json.dumps(data, indent=2, ensure_ascii=False)
+            path.write_text(text, encoding="utf-8")
 
             logger.debug(f"Wrote JSON file: {path}")
             return path
@@ -151,8 +152,7 @@ class FileSystemStorage(Storage):
             raise FileNotFoundError(f"JSON file not found: {path}")
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = json.loads(path.read_bytes())
             logger.debug(f"Read JSON file: {path}")
             return data
 
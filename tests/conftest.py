@@ -4,13 +4,18 @@ This module provides reusable test fixtures that can be used across all test fil
 Fixtures are automatically discovered by pytest and can be used as function arguments.
 """
 
+import dataclasses
 import json
 import tempfile
+import wave
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, Any
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
+from uuid import uuid4
 
 import pytest
+import requests
 from pydub import AudioSegment
 
 from voice_generation.core.models import (
@@ -22,6 +27,7 @@ from voice_generation.core.models import (
     VoiceConfig,
 )
 from voice_generation.clients.base import TTSClient
+from voice_generation.core.results import GenerationResult, SegmentResult
 from voice_generation.storage.filesystem import FileSystemStorage
 
 
@@ -30,20 +36,25 @@ from voice_generation.storage.filesystem import FileSystemStorage
 # ============================================================================
 
 
-@pytest.fixture
+_SAMPLE_EXERCISE_FIELDS: Dict[str, Any] = {
+    "id": "test-exercise-v1",
+    "title": "Test Exercise",
+    "description": "A test breathing exercise for unit tests",
+    "category": "testing",
+    "tags": ["test", "unit"],
+    "duration_seconds": 60,
+}
+
+
+# Model fixtures are session-scoped and shared across tests: do not mutate
+# them, use model_copy(deep=True) first.
+@pytest.fixture(scope="session")
 def sample_exercise() -> Exercise:
     """Sample exercise metadata for testing."""
-    return Exercise(
-        id="test-exercise-v1",
-        title="Test Exercise",
-        description="A test breathing exercise for unit tests",
-        category="testing",
-        tags=["test", "unit"],
-        duration_seconds=60,
-    )
+    return Exercise(**_SAMPLE_EXERCISE_FIELDS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_config() -> AudioConfig:
     """Sample audio configuration for narration segment."""
     return AudioConfig(
@@ -52,7 +63,7 @@ def sample_audio_config() -> AudioConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_breathing_pattern() -> BreathingPattern:
     """Sample breathing pattern for breathing cycle segment."""
     return BreathingPattern(
@@ -62,7 +73,7 @@ def sample_breathing_pattern() -> BreathingPattern:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_narration_segment(sample_audio_config: AudioConfig) -> Segment:
     """Sample narration-type segment."""
     return Segment(
@@ -72,7 +83,7 @@ def sample_narration_segment(sample_audio_config: AudioConfig) -> Segment:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_breathing_segment(
     sample_breathing_pattern: BreathingPattern,
     sample_audio_config: AudioConfig,
@@ -91,7 +102,7 @@ def sample_breathing_segment(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_voice_config() -> VoiceConfig:
     """Sample voice configuration."""
     return VoiceConfig(
@@ -103,7 +114,7 @@ def sample_voice_config() -> VoiceConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_narration_script(
     sample_exercise: Exercise,
     sample_narration_segment: Segment,
@@ -118,7 +129,7 @@ def sample_narration_script(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_script_dict(
     sample_exercise: Exercise,
     sample_narration_segment: Segment,
@@ -141,10 +152,42 @@ def sample_script_dict(
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio() -> AudioSegment:
-    """1-second silent audio segment for testing."""
-    return AudioSegment.silent(duration=1000)  # 1 second
+    """1-second silent audio segment for testing (immutable, shared per session)."""
+    # Built from raw PCM bytes to skip AudioSegment.silent()'s sample generation
+    raw = b"\x00\x00" * 22050  # 1 second of 16-bit mono silence at 22.05 kHz
+    return AudioSegment(data=raw, sample_width=2, frame_rate=22050, channels=1)
+
+
+# 1 second of 16-bit mono silence at 22.05 kHz, MP3-encoded (checked in so the
+# mocked API tests never run the encoder)
+_SAMPLE_MP3_PATH = Path(__file__).parent / "data" / "sample.mp3"
+
+
+@pytest.fixture(scope="session")
+def sample_mp3_bytes() -> bytes:
+    """MP3 payload standing in for ElevenLabs API response bodies (checked-in tests/data/sample.mp3)."""
+    if not _SAMPLE_MP3_PATH.exists():
+        pytest.fail(
+            f"Missing test data file {_SAMPLE_MP3_PATH}; restore it from version control "
+            f"(it is 1 second of silent 22.05 kHz mono audio encoded as MP3)"
+        )
+    return _SAMPLE_MP3_PATH.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def mock_success_response(sample_mp3_bytes: bytes) -> Mock:
+    """200 ElevenLabs response carrying sample MP3 audio (shared; do not mutate)."""
+    return Mock(status_code=200, content=sample_mp3_bytes)
+
+
+@pytest.fixture
+def mock_session(mock_success_response: Mock) -> Mock:
+    """requests.Session stand-in whose post() returns a 200 MP3 response by default."""
+    session = Mock(spec=requests.Session)
+    session.post.return_value = mock_success_response
+    return session
 
 
 @pytest.fixture
@@ -169,32 +212,60 @@ def sample_audio_list() -> list[AudioSegment]:
     ]
 
 
+def _wav_duration_ms(path: Path) -> int:
+    """Read WAV duration from the file header (no ffmpeg decode)."""
+    with wave.open(str(path), "rb") as wav:
+        return wav.getnframes() * 1000 // wav.getframerate()
+
+
+@pytest.fixture(scope="session")
+def wav_duration_ms():
+    """Header-only WAV duration reader: wav_duration_ms(path) -> milliseconds."""
+    return _wav_duration_ms
+
+
 # ============================================================================
 # Mock TTS Client
 # ============================================================================
 
 
+def _estimate_cost(text: str) -> float:
+    """Realistic cost estimate (ElevenLabs: $0.30 per 1K chars)."""
+    return (len(text) / 1000.0) * 0.30
+
+
+def _build_mock_tts_client() -> SimpleNamespace:
+    """Build a stand-in TTS client that returns 2-second audio for any input.
+
+    Only the methods get MagicMocks (for call tracking); the statistics are
+    plain attributes so tests can assign them directly.
+    """
+    return SimpleNamespace(
+        generate_audio=MagicMock(return_value=AudioSegment.silent(duration=2000)),
+        estimate_cost=MagicMock(side_effect=_estimate_cost),
+        total_characters=0,
+        total_api_calls=0,
+        cache_hits=0,
+        cache_misses=0,
+    )
+
+
 @pytest.fixture
-def mock_tts_client() -> Mock:
+def mock_tts_client() -> SimpleNamespace:
     """Mocked TTS client that returns 2-second audio for any input."""
-    client = Mock(spec=TTSClient)
+    return _build_mock_tts_client()
 
-    # Mock generate_audio to return 2-second silent audio
-    client.generate_audio.return_value = AudioSegment.silent(duration=2000)
 
-    # Mock estimate_cost to return realistic cost (ElevenLabs: $0.30 per 1K chars)
-    def estimate_cost_side_effect(text):
-        return (len(text) / 1000.0) * 0.30
+@pytest.fixture(scope="module")
+def make_mock_tts_client():
+    """Factory for stand-in TTS clients with per-use attribute overrides (e.g. cache_hits=5)."""
 
-    client.estimate_cost.side_effect = estimate_cost_side_effect
-
-    # Mock statistics
-    client.total_characters = 0
-    client.total_api_calls = 0
-    client.cache_hits = 0
-    client.cache_misses = 0
+    def _make(**overrides) -> SimpleNamespace:
+        client = _build_mock_tts_client()
+        vars(client).update(overrides)
+        return client
 
-    return client
+    return _make
 
 
 @pytest.fixture
@@ -220,18 +291,147 @@ def mock_tts_client_with_stats() -> Mock:
     return client
 
 
+class FakeElevenLabsClient:
+    """Hand-written stand-in for ElevenLabsClient used by the integration tests.
+
+    Cache statistics live on the class so tests can adjust them without
+    reaching the instance that generate_narration() builds internally.
+    """
+
+    audio: AudioSegment = None
+    cache_hits = 0
+    cache_misses = 2
+    init_kwargs: Dict[str, Any] = {}
+
+    def __init__(self, cache_dir=None, **kwargs):
+        self.cache_dir = cache_dir
+        FakeElevenLabsClient.init_kwargs = {"cache_dir": cache_dir, **kwargs}
+
+    def generate_audio(self, text, previous_text=None, next_text=None, **kwargs) -> AudioSegment:
+        return self.audio
+
+    def estimate_cost(self, text: str) -> float:
+        return _estimate_cost(text)
+
+
+@pytest.fixture(scope="module")
+def installed_fake_elevenlabs_client(sample_audio: AudioSegment):
+    """Install FakeElevenLabsClient as voice_generation.api.ElevenLabsClient for a module."""
+    FakeElevenLabsClient.audio = sample_audio
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("voice_generation.api.ElevenLabsClient", FakeElevenLabsClient)
+        yield FakeElevenLabsClient
+
+
+@pytest.fixture
+def fake_elevenlabs_client(installed_fake_elevenlabs_client):
+    """Installed FakeElevenLabsClient with its class-level state reset for this test."""
+    installed_fake_elevenlabs_client.cache_hits = 0
+    installed_fake_elevenlabs_client.cache_misses = 2
+    installed_fake_elevenlabs_client.init_kwargs = {}
+    return installed_fake_elevenlabs_client
+
+
+# ============================================================================
+# Result Fixtures
+# ============================================================================
+
+
+# Built once at import; dataclasses.replace() copies it without re-running
+# any spec introspection and rejects unknown field names like spec_set would.
+_GENERATION_RESULT_TEMPLATE = GenerationResult(
+    exercise_id="test-v1",
+    output_dir=Path("audio_out/test-v1"),
+    segment_count=0,
+    total_duration_ms=0,
+    metadata_path=Path("audio_out/test-v1/metadata.json"),
+)
+
+
+@pytest.fixture(scope="module")
+def make_generation_result():
+    """Factory for GenerationResult instances with per-test field overrides."""
+
+    def _make(**overrides) -> GenerationResult:
+        return dataclasses.replace(_GENERATION_RESULT_TEMPLATE, **overrides)
+
+    return _make
+
+
+_SEGMENT_RESULT_TEMPLATE = SegmentResult(
+    segment_id="intro",
+    segment_index=0,
+    audio_path=Path("intro_0.wav"),
+    duration_ms=5000,
+    fragment_count=1,
+)
+
+
+@pytest.fixture(scope="module")
+def make_segment_result():
+    """Factory for SegmentResult instances with per-test field overrides."""
+
+    def _make(**overrides) -> SegmentResult:
+        return dataclasses.replace(_SEGMENT_RESULT_TEMPLATE, **overrides)
+
+    return _make
+
+
 # ============================================================================
 # Storage Fixtures
 # ============================================================================
 
 
+@pytest.fixture(scope="session")
+def storage_root(tmp_path_factory) -> Path:
+    """Session-wide root directory shared by all temporary storages."""
+    return tmp_path_factory.mktemp("storage", numbered=True)
+
+
+@pytest.fixture(scope="module")
+def module_storage(storage_root: Path) -> FileSystemStorage:
+    """Filesystem storage shared by every test in a module.
+
+    Only for tests that never write through the storage; use temp_storage
+    when a test needs an isolated base directory.
+    """
+    return FileSystemStorage(storage_root / uuid4().hex)
+
+
+@pytest.fixture(scope="class")
+def class_storage(storage_root: Path) -> FileSystemStorage:
+    """Filesystem storage shared by the tests of one class.
+
+    Tests sharing it must use distinct file and exercise names; use
+    temp_storage when a test inspects the whole base directory.
+    """
+    return FileSystemStorage(storage_root / uuid4().hex)
+
+
 @pytest.fixture
-def temp_storage() -> FileSystemStorage:
-    """Temporary filesystem storage using system temp directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        storage = FileSystemStorage(tmpdir)
-        yield storage
-        # Cleanup happens automatically when context exits
+def temp_storage(storage_root: Path) -> FileSystemStorage:
+    """Temporary filesystem storage in a unique subdirectory of the session root."""
+    # pytest prunes old basetemp directories, so no per-test teardown is needed
+    return FileSystemStorage(storage_root / uuid4().hex)
+
+
+@pytest.fixture(scope="session")
+def exercise_root(tmp_path_factory) -> Path:
+    """Session-wide root for per-test exercise directories."""
+    return tmp_path_factory.mktemp("exercises")
+
+
+@pytest.fixture
+def make_exercise_dir(exercise_root: Path, request):
+    """Factory creating {exercise_root}/{test name}/{exercise_id} with a single mkdir call."""
+
+    def _make(exercise_id: str) -> Path:
+        exercise_dir = exercise_root / request.node.name / exercise_id
+        exercise_dir.mkdir(parents=True, exist_ok=True)
+        return exercise_dir
+
+    return _make
 
 
 @pytest.fixture
@@ -247,21 +447,25 @@ def temp_output_dir() -> Path:
 # ============================================================================
 
 
-@pytest.fixture
-def sample_json_file(sample_script_dict: Dict[str, Any], tmp_path: Path) -> Path:
-    """Temporary JSON file containing sample narration script."""
-    json_file = tmp_path / "test_script.json"
-    with open(json_file, "w") as f:
-        json.dump(sample_script_dict, f, indent=2)
+@pytest.fixture(scope="session")
+def sample_json_file(sample_script_dict: Dict[str, Any], tmp_path_factory) -> Path:
+    """Temporary JSON file containing sample narration script (read-only, shared per session)."""
+    json_file = tmp_path_factory.mktemp("sample_script") / "test_script.json"
+    json_file.write_text(json.dumps(sample_script_dict, indent=2))
     return json_file
 
 
+@pytest.fixture(scope="session")
+def sample_script_json_bytes(sample_json_file: Path) -> bytes:
+    """Raw bytes of sample_json_file, read once per session."""
+    return sample_json_file.read_bytes()
+
+
 @pytest.fixture
 def invalid_json_file(tmp_path: Path) -> Path:
     """Temporary JSON file with invalid content (missing required fields)."""
     json_file = tmp_path / "invalid_script.json"
-    with open(json_file, "w") as f:
-        json.dump({"invalid": "data"}, f)
+    json_file.write_text(json.dumps({"invalid": "data"}))
     return json_file
 
 
@@ -269,8 +473,7 @@ def invalid_json_file(tmp_path: Path) -> Path:
 def malformed_json_file(tmp_path: Path) -> Path:
     """Temporary file with malformed JSON syntax."""
     json_file = tmp_path / "malformed.json"
-    with open(json_file, "w") as f:
-        f.write('{"broken": json syntax}')  # Invalid JSON
+    json_file.write_text('{"broken": json syntax}')  # Invalid JSON
     return json_file
 
 
@@ -310,42 +513,100 @@ def missing_env_vars(monkeypatch):
     monkeypatch.delenv("VOICE_ID", raising=False)
 
 
-@pytest.fixture
-def simple_script(sample_exercise: Exercise) -> NarrationScript:
-    """Simple narration script with 2 segments for testing."""
+# Immutable building blocks for simple_script, validated once at import time.
+# Pydantic does not re-validate model instances passed as fields, so reusing
+# them skips re-validation. Do not mutate these; use model_copy() instead.
+_INTRO_BREATHING = BreathingPattern(duration_ms=10000, repetitions=1)
+_INTRO_AUDIO = AudioConfig(fragments=["Welcome to this exercise."])
+_PRACTICE_BREATHING = BreathingPattern(inhale_ms=4000, exhale_ms=6000, repetitions=3)
+_PRACTICE_AUDIO = AudioConfig(
+    fragments=["Breathe in slowly.", "Breathe out gently."],
+    max_duration_ms=9000,
+)
+_DEFAULT_VOICE = VoiceConfig()
+
+
+@pytest.fixture(scope="session")
+def simple_script() -> NarrationScript:
+    """Simple narration script with 2 segments for testing.
+
+    Shared across the session; tests that need to mutate it must work on
+    ``simple_script.model_copy(deep=True)``.
+    """
     return NarrationScript(
-        exercise=sample_exercise,
+        exercise=Exercise(**_SAMPLE_EXERCISE_FIELDS),
+        segments=[
+            Segment(id="intro", type="narration", breathing=_INTRO_BREATHING, audio=_INTRO_AUDIO),
+            Segment(id="practice", type="breathing_cycle", breathing=_PRACTICE_BREATHING, audio=_PRACTICE_AUDIO),
+        ],
+        voice_config=_DEFAULT_VOICE,
+    )
+
+
+@pytest.fixture(scope="session")
+def too_long_script() -> NarrationScript:
+    """Script whose estimated duration exceeds the validator's 1-hour limit."""
+    return NarrationScript(
+        exercise=Exercise(id="test-v1", title="Test"),
         segments=[
-            Segment(
-                id="intro",
-                type="narration",
-                breathing=BreathingPattern(duration_ms=10000, repetitions=1),
-                audio=AudioConfig(fragments=["Welcome to this exercise."]),
-            ),
             Segment(
                 id="practice",
                 type="breathing_cycle",
-                breathing=BreathingPattern(inhale_ms=4000, exhale_ms=6000, repetitions=3),
-                audio=AudioConfig(
-                    fragments=["Breathe in slowly.", "Breathe out gently."],
-                    max_duration_ms=9000,
+                breathing=BreathingPattern(
+                    inhale_ms=4000,
+                    exhale_ms=6000,
+                    repetitions=500,  # 500 * 10s = 5000s > 3600s
                 ),
+                audio=AudioConfig(fragments=["Breathe."]),
             ),
         ],
-        voice_config=VoiceConfig(),
+        voice_config=_DEFAULT_VOICE,
     )
 
 
-@pytest.fixture
-def generator_with_mocks(mock_tts_client: Mock, temp_storage: FileSystemStorage):
-    """VoiceNarrationGenerator with mocked TTS client and temp storage."""
+@pytest.fixture(scope="session")
+def long_fragment_script() -> NarrationScript:
+    """Valid script with a 1001-character fragment (triggers a long-text warning)."""
+    return NarrationScript(
+        exercise=Exercise(id="test-v1", title="Test"),
+        segments=[
+            Segment(
+                id="intro",
+                type="narration",
+                breathing=BreathingPattern(duration_ms=5000, repetitions=1),
+                audio=AudioConfig(fragments=["A" * 1001]),  # > 1000 chars = warning
+            ),
+        ],
+        voice_config=_DEFAULT_VOICE,
+    )
+
+
+@pytest.fixture(scope="session")
+def session_generator(storage_root: Path):
+    """VoiceNarrationGenerator built once per session (use generator_with_mocks in tests)."""
     from voice_generation.core.generator import VoiceNarrationGenerator
 
-    generator = VoiceNarrationGenerator(
-        tts_client=mock_tts_client,
-        storage=temp_storage,
+    return VoiceNarrationGenerator(
+        tts_client=_build_mock_tts_client(),
+        storage=FileSystemStorage(storage_root / "generator"),
     )
-    return generator
+
+
+@pytest.fixture
+def generator_with_mocks(session_generator, temp_storage, monkeypatch):
+    """VoiceNarrationGenerator with mocked TTS client and temp storage.
+
+    The session generator is reused; its TTS mock is reset and its storage is
+    swapped for per-test storage, so output checks never see earlier tests' files.
+    """
+    monkeypatch.setattr(session_generator, "storage", temp_storage)
+    tts = session_generator.tts
+    tts.estimate_cost.reset_mock()
+    tts.generate_audio.reset_mock(return_value=True, side_effect=True)
+    tts.generate_audio.return_value = AudioSegment.silent(duration=2000)
+    tts.cache_hits = 0
+    tts.cache_misses = 0
+    return session_generator
 
 
 @pytest.fixture
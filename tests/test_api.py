@@ -13,7 +13,7 @@ Test Coverage Goals:
 
 import pytest
 from pathlib import Path
-from unittest.mock import patch, Mock
+from unittest.mock import ANY, patch, Mock
 
 from voice_generation.api import generate_narration
 from voice_generation.core.models import NarrationScript, Exercise, Segment, BreathingPattern, AudioConfig, VoiceConfig
@@ -214,12 +214,16 @@ class TestVoiceConfigIntegration:
         generate_narration(simple_script_json)
 
         # Verify TTS client created with voice config from script
-        call_kwargs = mock_client_class.call_args[1]
-        assert call_kwargs["model"] == "eleven_multilingual_v2"
-        assert call_kwargs["stability"] == 0.6
-        assert call_kwargs["similarity_boost"] == 0.7
-        assert call_kwargs["style"] == 0.15
-        assert call_kwargs["use_speaker_boost"] is True
+        mock_client_class.assert_called_once_with(
+            api_key=ANY,
+            voice_id=ANY,
+            cache_dir=ANY,
+            model="eleven_multilingual_v2",
+            stability=0.6,
+            similarity_boost=0.7,
+            style=0.15,
+            use_speaker_boost=True,
+        )
 
 
 # ============================================================================
@@ -230,7 +234,7 @@ class TestVoiceConfigIntegration:
 class TestAPIErrorHandling:
     """Test error handling in API layer."""
 
-    def test_nonexistent_file_raises_error(self, mock_env_vars):
+    def test_nonexistent_file_raises_error(self):
         """Test nonexistent input file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError):
             generate_narration("nonexistent_file.json")
@@ -238,7 +242,7 @@ class TestAPIErrorHandling:
     @patch('voice_generation.api.VoiceNarrationGenerator')
     @patch('voice_generation.api.ElevenLabsClient')
     def test_invalid_json_raises_error(
-        self, mock_client_class, mock_generator_class, invalid_json_file, mock_env_vars
+        self, mock_client_class, mock_generator_class, invalid_json_file
     ):
         """Test invalid JSON raises appropriate error."""
         with pytest.raises(Exception):  # JSONDecodeError or ValidationError
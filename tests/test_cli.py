@@ -10,15 +10,39 @@ Test Coverage Goals:
 - Exit codes
 """
 
+import logging
 import pytest
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, Mock, MagicMock
 from io import StringIO
 
 from voice_generation.__main__ import main
 from voice_generation.core.exceptions import ValidationError, TTSError
-from voice_generation.core.results import GenerationResult
+
+
+def _cli_status_records(caplog, status):
+    """Return CLI log records emitted with the given structured status."""
+    return [r for r in caplog.records if r.name == "voice_generation.cli" and getattr(r, "status", None) == status]
+
+
+@pytest.fixture
+def make_mock_script(monkeypatch):
+    """Factory that installs a lightweight script as NarrationScript.from_file's return value."""
+
+    def _make(title="Test", segments=(), duration_ms=0) -> SimpleNamespace:
+        script = SimpleNamespace(
+            exercise=SimpleNamespace(title=title),
+            segments=list(segments),
+            estimate_total_duration_ms=lambda: duration_ms,
+        )
+        monkeypatch.setattr(
+            "voice_generation.__main__.NarrationScript.from_file", staticmethod(lambda _path: script)
+        )
+        return script
+
+    return _make
 
 
 # ============================================================================
@@ -30,25 +54,15 @@ class TestCLIArgumentParsing:
     """Test command-line argument parsing."""
 
     @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_basic_invocation(self, mock_script_class, mock_generate, simple_script_json, capsys):
+    def test_basic_invocation(self, mock_generate, simple_script_json, make_mock_script, make_generation_result):
         """Test basic CLI invocation with minimal arguments."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = [Mock(), Mock()]
-        mock_script.estimate_total_duration_ms.return_value = 60000
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_result = Mock(spec=GenerationResult)
-        mock_result.exercise_id = "test-v1"
-        mock_result.segment_count = 2
-        mock_result.total_duration_seconds = 60.0
-        mock_result.output_dir = Path("audio_out/test-v1")
-        mock_result.metadata_path = Path("audio_out/test-v1/metadata.json")
-        mock_result.audio_files = [Path("file1.wav"), Path("file2.wav")]
-        mock_result.cache_hit_count = 0
-        mock_result.cache_miss_count = 0
-        mock_generate.return_value = mock_result
+        make_mock_script(segments=[SimpleNamespace(), SimpleNamespace()], duration_ms=60000)
+
+        mock_generate.return_value = make_generation_result(
+            segment_count=2,
+            total_duration_ms=60000,
+            audio_files=[Path("file1.wav"), Path("file2.wav")],
+        )
 
         with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
             exit_code = main()
@@ -57,14 +71,9 @@ class TestCLIArgumentParsing:
         mock_generate.assert_called_once()
 
     @patch('voice_generation.__main__.NarrationValidator')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_custom_output_dir(self, mock_script_class, mock_validator_class, simple_script_json, tmp_path):
+    def test_custom_output_dir(self, mock_validator_class, simple_script_json, make_mock_script, tmp_path):
         """Test --output-dir argument."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
+        make_mock_script()
 
         mock_validator = Mock()
         mock_validation = Mock()
@@ -89,15 +98,10 @@ class TestCLIArgumentParsing:
 class TestDryRunMode:
     """Test --dry-run mode (validation only)."""
 
-    @patch('voice_generation.__main__.NarrationScript')
     @patch('voice_generation.__main__.NarrationValidator')
-    def test_dry_run_valid_script(self, mock_validator_class, mock_script_class, simple_script_json, capsys):
+    def test_dry_run_valid_script(self, mock_validator_class, simple_script_json, make_mock_script, caplog, capsys):
         """Test dry-run with valid script."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test Exercise"
-        mock_script.segments = [Mock()]
-        mock_script.estimate_total_duration_ms.return_value = 30000
-        mock_script_class.from_file.return_value = mock_script
+        make_mock_script(title="Test Exercise", segments=[SimpleNamespace()], duration_ms=30000)
 
         mock_validator = Mock()
         mock_validation = Mock()
@@ -106,22 +110,18 @@ class TestDryRunMode:
         mock_validator.validate.return_value = mock_validation
         mock_validator_class.return_value = mock_validator
 
+        caplog.set_level(logging.DEBUG, logger="voice_generation.cli")
         with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--dry-run']):
             exit_code = main()
 
         assert exit_code == 0
-        captured = capsys.readouterr()
-        assert "Validation passed" in captured.out
+        assert len(_cli_status_records(caplog, "validation_passed")) == 1
+        assert "✓ Validation passed" in capsys.readouterr().out
 
-    @patch('voice_generation.__main__.NarrationScript')
     @patch('voice_generation.__main__.NarrationValidator')
-    def test_dry_run_invalid_script(self, mock_validator_class, mock_script_class, simple_script_json, capsys):
+    def test_dry_run_invalid_script(self, mock_validator_class, simple_script_json, make_mock_script, caplog, capsys):
         """Test dry-run with invalid script."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
+        make_mock_script()
 
         mock_validator = Mock()
         mock_validation = Mock()
@@ -130,22 +130,21 @@ class TestDryRunMode:
         mock_validator.validate.return_value = mock_validation
         mock_validator_class.return_value = mock_validator
 
+        caplog.set_level(logging.DEBUG, logger="voice_generation.cli")
         with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--dry-run']):
             exit_code = main()
 
         assert exit_code == 1
+        [record] = _cli_status_records(caplog, "validation_failed")
+        assert record.error_count == 2
         captured = capsys.readouterr()
-        assert "Validation failed" in captured.out
+        assert "✗ Validation failed:" in captured.out
+        assert "✗ Error 2" in captured.out
 
-    @patch('voice_generation.__main__.NarrationScript')
     @patch('voice_generation.__main__.NarrationValidator')
-    def test_dry_run_with_warnings(self, mock_validator_class, mock_script_class, simple_script_json, capsys):
+    def test_dry_run_with_warnings(self, mock_validator_class, simple_script_json, make_mock_script, caplog, capsys):
         """Test dry-run displays warnings."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
+        make_mock_script()
 
         mock_validator = Mock()
         mock_validation = Mock()
@@ -154,12 +153,16 @@ class TestDryRunMode:
         mock_validator.validate.return_value = mock_validation
         mock_validator_class.return_value = mock_validator
 
+        caplog.set_level(logging.DEBUG, logger="voice_generation.cli")
         with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--dry-run']):
             exit_code = main()
 
         assert exit_code == 0
+        [record] = _cli_status_records(caplog, "validation_passed")
+        assert record.warning_count == 2
         captured = capsys.readouterr()
-        assert "Warning" in captured.out
+        assert "Warnings (2):" in captured.out
+        assert "Warning 1" in captured.out
 
 
 # ============================================================================
@@ -170,28 +173,26 @@ class TestDryRunMode:
 class TestCostEstimationMode:
     """Test --estimate-cost mode."""
 
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_estimate_cost(self, mock_script_class, simple_script_json, capsys):
+    def test_estimate_cost(self, simple_script_json, make_mock_script, caplog, capsys):
         """Test cost estimation mode."""
-        mock_segment1 = Mock()
-        mock_segment1.audio.fragments = ["Text 1", "Text 2"]
-        mock_segment2 = Mock()
-        mock_segment2.audio.fragments = ["Text 3"]
-
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = [mock_segment1, mock_segment2]
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
+        make_mock_script(
+            segments=[
+                SimpleNamespace(audio=SimpleNamespace(fragments=["Text 1", "Text 2"])),
+                SimpleNamespace(audio=SimpleNamespace(fragments=["Text 3"])),
+            ]
+        )
+
+        caplog.set_level(logging.DEBUG, logger="voice_generation.cli")
         with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--estimate-cost']):
             exit_code = main()
 
         assert exit_code == 0
+        [record] = _cli_status_records(caplog, "cost_estimated")
+        assert record.total_characters == 18
+        assert record.estimated_usd == pytest.approx(18 / 1000 * 0.30)
         captured = capsys.readouterr()
-        assert "Estimating costs" in captured.out
-        assert "Total characters" in captured.out
-        assert "Estimated cost" in captured.out
+        assert "Total characters: 18" in captured.out
+        assert "Estimated cost: $0.01 USD" in captured.out
 
 
 # ============================================================================
@@ -202,60 +203,46 @@ class TestCostEstimationMode:
 class TestGenerationMode:
     """Test normal generation mode."""
 
-    @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_generation_success(self, mock_script_class, mock_generate, simple_script_json, capsys):
+    def test_generation_success(
+        self, monkeypatch, simple_script_json, make_mock_script, make_generation_result, capsys, caplog
+    ):
         """Test successful generation."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test Exercise"
-        mock_script.segments = [Mock(), Mock()]
-        mock_script.estimate_total_duration_ms.return_value = 45000
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_result = Mock(spec=GenerationResult)
-        mock_result.exercise_id = "test-exercise-v1"
-        mock_result.segment_count = 2
-        mock_result.total_duration_seconds = 45.0
-        mock_result.output_dir = Path("audio_out/test-exercise-v1")
-        mock_result.metadata_path = Path("audio_out/test-exercise-v1/metadata.json")
-        mock_result.audio_files = [Path("audio1.wav"), Path("audio2.wav")]
-        mock_result.cache_hit_count = 5
-        mock_result.cache_miss_count = 3
-        mock_result.cache_hit_rate = 62.5
-        mock_generate.return_value = mock_result
+        make_mock_script(title="Test Exercise", segments=[SimpleNamespace(), SimpleNamespace()], duration_ms=45000)
 
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
-            exit_code = main()
+        mock_result = make_generation_result(
+            exercise_id="test-exercise-v1",
+            segment_count=2,
+            total_duration_ms=45000,
+            output_dir=Path("audio_out/test-exercise-v1"),
+            metadata_path=Path("audio_out/test-exercise-v1/metadata.json"),
+            audio_files=[Path("audio1.wav"), Path("audio2.wav")],
+            cache_hit_count=5,
+            cache_miss_count=3,
+        )
+
+        monkeypatch.setattr("voice_generation.__main__.generate_narration", Mock(return_value=mock_result))
+        monkeypatch.setattr(sys, "argv", ["voice_generation", str(simple_script_json)])
+
+        caplog.set_level(logging.DEBUG, logger="voice_generation.cli")
+        exit_code = main()
 
         assert exit_code == 0
+        [record] = _cli_status_records(caplog, "generation_complete")
+        assert record.exercise_id == "test-exercise-v1"
         captured = capsys.readouterr()
         assert "GENERATION COMPLETE" in captured.out
         assert "test-exercise-v1" in captured.out
         assert "Cache hit rate" in captured.out
 
-    @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_generation_with_no_cache(self, mock_script_class, mock_generate, simple_script_json):
+    def test_generation_with_no_cache(self, monkeypatch, simple_script_json, make_mock_script, make_generation_result):
         """Test generation with --no-cache flag."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_result = Mock(spec=GenerationResult)
-        mock_result.exercise_id = "test-v1"
-        mock_result.segment_count = 0
-        mock_result.total_duration_seconds = 0
-        mock_result.output_dir = Path("audio_out/test-v1")
-        mock_result.metadata_path = Path("metadata.json")
-        mock_result.audio_files = []
-        mock_result.cache_hit_count = 0
-        mock_result.cache_miss_count = 0
-        mock_generate.return_value = mock_result
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--no-cache']):
-            exit_code = main()
+        make_mock_script()
+        mock_generate = Mock(return_value=make_generation_result(metadata_path=Path("metadata.json")))
+
+        monkeypatch.setattr("voice_generation.__main__.generate_narration", mock_generate)
+        monkeypatch.setattr(sys, "argv", ["voice_generation", str(simple_script_json), "--no-cache"])
+
+        exit_code = main()
 
         assert exit_code == 0
         # Verify cache_dir=None was passed
@@ -271,83 +258,46 @@ class TestGenerationMode:
 class TestErrorHandling:
     """Test CLI error handling."""
 
-    def test_file_not_found(self, capsys):
-        """Test FileNotFoundError handling."""
-        with patch.object(sys, 'argv', ['voice_generation', 'nonexistent.json']):
-            exit_code = main()
-
-        assert exit_code == 1
+    @pytest.mark.parametrize(
+        "raised_by,exc,expected_stderr,expected_exit_code",
+        [
+            pytest.param("from_file", FileNotFoundError("nonexistent.json"), "File not found", 1, id="file_not_found"),
+            pytest.param(
+                "generate",
+                ValidationError(["Error 1", "Error 2"], message="Validation failed"),
+                "Validation error",
+                1,
+                id="validation",
+            ),
+            pytest.param("generate", TTSError("API failed"), "TTS generation error", 1, id="tts"),
+            pytest.param("generate", ValueError("Missing API key"), "Configuration error", 1, id="value"),
+            pytest.param("from_file", KeyboardInterrupt(), "Interrupted by user", 130, id="keyboard_interrupt"),
+        ],
+    )
+    def test_error_handling(
+        self,
+        raised_by,
+        exc,
+        expected_stderr,
+        expected_exit_code,
+        monkeypatch,
+        simple_script_json,
+        make_mock_script,
+        capsys,
+    ):
+        """Test each handled exception maps to its stderr message and exit code."""
+        if raised_by == "from_file":
+            monkeypatch.setattr("voice_generation.__main__.NarrationScript.from_file", Mock(side_effect=exc))
+        else:
+            make_mock_script()
+            monkeypatch.setattr("voice_generation.__main__.generate_narration", Mock(side_effect=exc))
+        monkeypatch.setattr(sys, "argv", ["voice_generation", str(simple_script_json)])
+
+        exit_code = main()
+
+        assert exit_code == expected_exit_code
         captured = capsys.readouterr()
-        assert "File not found" in captured.err
-
-    @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_validation_error(self, mock_script_class, mock_generate, simple_script_json, capsys):
-        """Test ValidationError handling."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_generate.side_effect = ValidationError(["Error 1", "Error 2"], message="Validation failed")
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
-            exit_code = main()
-
-        assert exit_code == 1
-        captured = capsys.readouterr()
-        assert "Validation error" in captured.err
-
-    @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_tts_error(self, mock_script_class, mock_generate, simple_script_json, capsys):
-        """Test TTSError handling."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_generate.side_effect = TTSError("API failed")
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
-            exit_code = main()
-
-        assert exit_code == 1
-        captured = capsys.readouterr()
-        assert "TTS generation error" in captured.err
-
-    @patch('voice_generation.__main__.generate_narration')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_value_error(self, mock_script_class, mock_generate, simple_script_json, capsys):
-        """Test ValueError handling (configuration errors)."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
-        mock_generate.side_effect = ValueError("Missing API key")
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
-            exit_code = main()
-
-        assert exit_code == 1
-        captured = capsys.readouterr()
-        assert "Configuration error" in captured.err
-
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_keyboard_interrupt(self, mock_script_class, simple_script_json, capsys):
-        """Test KeyboardInterrupt handling."""
-        mock_script_class.from_file.side_effect = KeyboardInterrupt()
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json)]):
-            exit_code = main()
-
-        assert exit_code == 130
-        captured = capsys.readouterr()
-        assert "Interrupted by user" in captured.err
+        assert expected_stderr in captured.err
 
 
 # ============================================================================
@@ -358,17 +308,14 @@ class TestErrorHandling:
 class TestVerboseMode:
     """Test verbose logging mode."""
 
-    @patch('voice_generation.__main__.logging.basicConfig')
-    @patch('voice_generation.__main__.NarrationScript')
-    def test_verbose_flag_enables_logging(self, mock_script_class, mock_logging, simple_script_json):
+    def test_verbose_flag_enables_logging(self, monkeypatch, simple_script_json, make_mock_script):
         """Test --verbose flag enables logging."""
-        mock_script = Mock()
-        mock_script.exercise.title = "Test"
-        mock_script.segments = []
-        mock_script.estimate_total_duration_ms.return_value = 0
-        mock_script_class.from_file.return_value = mock_script
-
-        with patch.object(sys, 'argv', ['voice_generation', str(simple_script_json), '--dry-run', '--verbose']):
-            main()
+        make_mock_script()
+        mock_logging = Mock()
+
+        monkeypatch.setattr("voice_generation.__main__.logging.basicConfig", mock_logging)
+        monkeypatch.setattr(sys, "argv", ["voice_generation", str(simple_script_json), "--dry-run", "--verbose"])
+
+        main()
 
         mock_logging.assert_called_once()
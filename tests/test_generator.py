@@ -11,11 +11,9 @@ Test Coverage Goals:
 - Statistics tracking (cache hits/misses)
 """
 
-import pytest
-from pathlib import Path
-from unittest.mock import Mock, MagicMock
 
-from pydub import AudioSegment
+import pytest
+from unittest.mock import MagicMock
 
 from voice_generation.core.generator import VoiceNarrationGenerator
 from voice_generation.core.models import (
@@ -23,6 +21,26 @@ from voice_generation.core.models import (
 )
 from voice_generation.core.exceptions import ValidationError, SegmentProcessingError, TTSError
 from voice_generation.core.results import GenerationResult, ValidationResult, CostEstimate
+from voice_generation.storage.filesystem import FileSystemStorage
+
+
+@pytest.fixture(scope="module")
+def generated_once(tmp_path_factory, simple_script, make_mock_tts_client):
+    """Generate simple_script once per module and return (result, generator)."""
+    tts = make_mock_tts_client(cache_hits=5, cache_misses=3)
+
+    generator = VoiceNarrationGenerator(
+        tts_client=tts,
+        storage=FileSystemStorage(tmp_path_factory.mktemp("generated")),
+    )
+    return generator.generate(simple_script), generator
+
+
+@pytest.fixture(scope="module")
+def generated_metadata(generated_once):
+    """Result of generated_once with its metadata JSON parsed: (result, metadata)."""
+    result, generator = generated_once
+    return result, generator.storage.read_json(result.metadata_path)
 
 
 # ============================================================================
@@ -33,38 +51,32 @@ from voice_generation.core.results import GenerationResult, ValidationResult, Co
 class TestGeneratorInitialization:
     """Test generator initialization and configuration."""
 
-    def test_init_with_required_params(self, mock_tts_client, temp_storage):
-        """Test initializing generator with required parameters only."""
-        generator = VoiceNarrationGenerator(
-            tts_client=mock_tts_client,
-            storage=temp_storage,
-        )
-
-        assert generator.tts == mock_tts_client
-        assert generator.storage == temp_storage
-        assert generator.audio is not None
-        assert generator.validator is not None
-        assert generator.verbose is False
-
-    def test_init_with_custom_components(self, mock_tts_client, temp_storage):
-        """Test initializing generator with custom audio processor and validator."""
+    @pytest.mark.parametrize("custom", [False, True], ids=["defaults", "custom_components"])
+    def test_init(self, mock_tts_client, module_storage, custom):
+        """Test initializing generator with default or custom audio processor and validator."""
         from voice_generation.processors.audio import AudioProcessor
         from voice_generation.core.validator import NarrationValidator
 
-        custom_audio = AudioProcessor()
-        custom_validator = NarrationValidator()
+        kwargs = (
+            {"audio_processor": AudioProcessor(), "validator": NarrationValidator(), "verbose": True}
+            if custom
+            else {}
+        )
 
         generator = VoiceNarrationGenerator(
             tts_client=mock_tts_client,
-            storage=temp_storage,
-            audio_processor=custom_audio,
-            validator=custom_validator,
-            verbose=True,
+            storage=module_storage,
+            **kwargs,
         )
 
-        assert generator.audio == custom_audio
-        assert generator.validator == custom_validator
-        assert generator.verbose is True
+        assert generator.tts == mock_tts_client
+        assert generator.storage == module_storage
+        assert isinstance(generator.audio, AudioProcessor)
+        assert isinstance(generator.validator, NarrationValidator)
+        assert generator.verbose is custom
+        if custom:
+            assert generator.audio is kwargs["audio_processor"]
+            assert generator.validator is kwargs["validator"]
 
 
 # ============================================================================
@@ -83,27 +95,9 @@ class TestGeneratorValidation:
         assert result.is_valid is True
         assert len(result.errors) == 0
 
-    def test_validate_invalid_script(self, generator_with_mocks):
+    def test_validate_invalid_script(self, generator_with_mocks, too_long_script):
         """Test validating an invalid script (exercise duration too long)."""
-        # Create script with duration > MAX_EXERCISE_DURATION_SECONDS (3600s)
-        script = NarrationScript(
-            exercise=Exercise(id="test-v1", title="Test"),
-            segments=[
-                Segment(
-                    id="practice",
-                    type="breathing_cycle",
-                    breathing=BreathingPattern(
-                        inhale_ms=4000,
-                        exhale_ms=6000,
-                        repetitions=500,  # 500 * 10s = 5000s > 3600s
-                    ),
-                    audio=AudioConfig(fragments=["Breathe."]),
-                ),
-            ],
-            voice_config=VoiceConfig(),
-        )
-
-        result = generator_with_mocks.validate(script)
+        result = generator_with_mocks.validate(too_long_script)
 
         assert result.is_valid is False
         assert len(result.errors) > 0
@@ -156,51 +150,39 @@ class TestCostEstimation:
 class TestSegmentProcessing:
     """Test individual segment processing."""
 
-    def test_process_segment_single_fragment(self, generator_with_mocks, tmp_path, sample_audio):
-        """Test processing segment with single fragment."""
+    @pytest.mark.parametrize(
+        "segment_id,fragments,expected_calls",
+        [
+            pytest.param("intro", ["Welcome."], 1, id="single_fragment"),
+            pytest.param("practice", ["Breathe in.", "Hold.", "Breathe out."], 3, id="multiple_fragments"),
+        ],
+    )
+    def test_process_segment_fragments(
+        self, generator_with_mocks, tmp_path, sample_audio, segment_id, fragments, expected_calls
+    ):
+        """Test processing segment generates and stitches one TTS call per fragment."""
         generator_with_mocks.tts.generate_audio.return_value = sample_audio
 
         segment = Segment(
-            id="intro",
+            id=segment_id,
             type="narration",
             breathing=BreathingPattern(duration_ms=5000, repetitions=1),
-            audio=AudioConfig(fragments=["Welcome."]),
+            audio=AudioConfig(fragments=fragments),
         )
 
-        output_dir = tmp_path / "test-v1"
-        output_dir.mkdir()
-
-        result = generator_with_mocks._process_segment(segment, 0, output_dir)
+        result = generator_with_mocks._process_segment(segment, 0, tmp_path)
 
-        assert result.segment_id == "intro"
+        assert result.segment_id == segment_id
         assert result.segment_index == 0
-        assert result.fragment_count == 1
-        assert result.duration_ms > 0
+        assert result.fragment_count == expected_calls
+        # Every fragment's audio is stitched into the segment
+        assert result.duration_ms >= expected_calls * len(sample_audio)
+        assert result.audio_path == tmp_path / f"{segment_id}_0.wav"
         assert result.audio_path.exists()
         assert result.was_shortened is False
 
-        # Verify TTS was called once
-        assert generator_with_mocks.tts.generate_audio.call_count == 1
-
-    def test_process_segment_multiple_fragments(self, generator_with_mocks, tmp_path, sample_audio):
-        """Test processing segment with multiple fragments (stitching)."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        segment = Segment(
-            id="practice",
-            type="breathing_cycle",
-            breathing=BreathingPattern(inhale_ms=4000, exhale_ms=6000, repetitions=5),
-            audio=AudioConfig(fragments=["Breathe in.", "Hold.", "Breathe out."]),
-        )
-
-        output_dir = tmp_path / "test-v1"
-        output_dir.mkdir()
-
-        result = generator_with_mocks._process_segment(segment, 0, output_dir)
-
-        assert result.fragment_count == 3
         # Verify TTS was called for each fragment
-        assert generator_with_mocks.tts.generate_audio.call_count == 3
+        assert generator_with_mocks.tts.generate_audio.call_count == expected_calls
 
     def test_process_segment_with_context(self, generator_with_mocks, tmp_path, sample_audio):
         """Test segment processing passes context to TTS."""
@@ -213,20 +195,10 @@ class TestSegmentProcessing:
             audio=AudioConfig(fragments=["First.", "Second.", "Third."]),
         )
 
-        output_dir = tmp_path / "test-v1"
-        output_dir.mkdir()
-
-        generator_with_mocks._process_segment(segment, 0, output_dir)
-
-        # Check that context was passed for middle fragment
-        calls = generator_with_mocks.tts.generate_audio.call_args_list
+        generator_with_mocks._process_segment(segment, 0, tmp_path)
 
-        # Second call (index 1) should have previous and next text
-        second_call = calls[1]
-        text, previous, next_text = second_call[0]
-        assert text == "Second."
-        assert previous == "First."
-        assert next_text == "Third."
+        # Middle fragment should be generated with previous and next text as context
+        generator_with_mocks.tts.generate_audio.assert_any_call("Second.", "First.", "Third.")
 
     def test_process_segment_tts_failure_raises_error(self, generator_with_mocks, tmp_path):
         """Test TTS failure raises TTSError."""
@@ -239,11 +211,8 @@ class TestSegmentProcessing:
             audio=AudioConfig(fragments=["Test."]),
         )
 
-        output_dir = tmp_path / "test-v1"
-        output_dir.mkdir()
-
         with pytest.raises(TTSError) as exc_info:
-            generator_with_mocks._process_segment(segment, 0, output_dir)
+            generator_with_mocks._process_segment(segment, 0, tmp_path)
 
         assert "failed to generate audio" in str(exc_info.value).lower()
 
@@ -256,11 +225,9 @@ class TestSegmentProcessing:
 class TestFullGenerationWorkflow:
     """Test complete generation workflow end-to-end."""
 
-    def test_generate_simple_script(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_simple_script(self, generated_once, simple_script):
         """Test generating audio for simple valid script."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        result = generator_with_mocks.generate(simple_script)
+        result, _ = generated_once
 
         assert isinstance(result, GenerationResult)
         assert result.exercise_id == simple_script.exercise.id
@@ -270,53 +237,41 @@ class TestFullGenerationWorkflow:
         assert result.metadata_path.exists()
         assert len(result.audio_files) == result.segment_count
 
-    def test_generate_creates_output_directory(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_creates_output_directory(self, generated_once, simple_script):
         """Test generation creates exercise directory."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        result = generator_with_mocks.generate(simple_script)
+        result, generator = generated_once
 
-        expected_dir = generator_with_mocks.storage.base_dir / simple_script.exercise.id
+        expected_dir = generator.storage.base_dir / simple_script.exercise.id
         assert expected_dir.exists()
         assert result.output_dir == expected_dir
 
-    def test_generate_writes_metadata(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_writes_metadata(self, generated_metadata, simple_script):
         """Test generation writes metadata JSON."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        result = generator_with_mocks.generate(simple_script)
+        result, metadata = generated_metadata
 
         metadata_path = result.metadata_path
         assert metadata_path.exists()
         assert metadata_path.suffix == ".json"
 
-        # Verify metadata can be read back
-        metadata = generator_with_mocks.storage.read_json(metadata_path)
+        # Verify metadata was readable and matches the script
         assert metadata["exercise_id"] == simple_script.exercise.id
         assert "segments" in metadata
         assert "breath_cycles" in metadata
 
-    def test_generate_writes_audio_files(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_writes_audio_files(self, generated_once, wav_duration_ms):
         """Test generation writes WAV audio files."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        result = generator_with_mocks.generate(simple_script)
+        result, _ = generated_once
 
         for audio_file in result.audio_files:
             assert audio_file.exists()
             assert audio_file.suffix == ".wav"
 
-            # Verify audio can be read back
-            audio = AudioSegment.from_file(audio_file)
-            assert len(audio) > 0
+            # Verify audio header is readable and non-empty
+            assert wav_duration_ms(audio_file) > 0
 
-    def test_generate_tracks_cache_statistics(self, generator_with_mocks, simple_script, sample_audio):
-        """Test generation tracks TTS cache statistics."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-        generator_with_mocks.tts.cache_hits = 5
-        generator_with_mocks.tts.cache_misses = 3
-
-        result = generator_with_mocks.generate(simple_script)
+    def test_generate_tracks_cache_statistics(self, generated_once):
+        """Test generation tracks TTS cache statistics (generated_once reports 5 hits, 3 misses)."""
+        result, _ = generated_once
 
         assert result.cache_hit_count == 5
         assert result.cache_miss_count == 3
@@ -331,28 +286,10 @@ class TestFullGenerationWorkflow:
 class TestGeneratorErrorHandling:
     """Test error handling and recovery."""
 
-    def test_generate_invalid_script_raises_validation_error(self, generator_with_mocks):
+    def test_generate_invalid_script_raises_validation_error(self, generator_with_mocks, too_long_script):
         """Test generating invalid script raises ValidationError."""
-        # Script with exercise duration too long
-        script = NarrationScript(
-            exercise=Exercise(id="test-v1", title="Test"),
-            segments=[
-                Segment(
-                    id="practice",
-                    type="breathing_cycle",
-                    breathing=BreathingPattern(
-                        inhale_ms=4000,
-                        exhale_ms=6000,
-                        repetitions=500,  # Too many repetitions
-                    ),
-                    audio=AudioConfig(fragments=["Breathe."]),
-                ),
-            ],
-            voice_config=VoiceConfig(),
-        )
-
         with pytest.raises(ValidationError) as exc_info:
-            generator_with_mocks.generate(script)
+            generator_with_mocks.generate(too_long_script)
 
         assert "validation failed" in str(exc_info.value).lower()
 
@@ -369,25 +306,11 @@ class TestGeneratorErrorHandling:
         assert error.segment_id is not None
         assert error.index is not None
 
-    def test_generate_logs_warnings(self, generator_with_mocks, sample_audio, caplog):
+    def test_generate_logs_warnings(self, generator_with_mocks, long_fragment_script, sample_audio, caplog):
         """Test generation logs validation warnings."""
-        # Script with warnings (long text)
-        script = NarrationScript(
-            exercise=Exercise(id="test-v1", title="Test"),
-            segments=[
-                Segment(
-                    id="intro",
-                    type="narration",
-                    breathing=BreathingPattern(duration_ms=5000, repetitions=1),
-                    audio=AudioConfig(fragments=["A" * 1001]),  # > 1000 chars = warning
-                ),
-            ],
-            voice_config=VoiceConfig(),
-        )
-
         generator_with_mocks.tts.generate_audio.return_value = sample_audio
 
-        result = generator_with_mocks.generate(script)
+        result = generator_with_mocks.generate(long_fragment_script)
 
         # Should complete successfully despite warnings
         assert isinstance(result, GenerationResult)
@@ -401,34 +324,25 @@ class TestGeneratorErrorHandling:
 class TestComponentIntegration:
     """Test integration with audio processor, metadata builder, etc."""
 
-    def test_generate_calls_audio_processor_methods(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_calls_audio_processor_methods(self, generator_with_mocks, simple_script, sample_audio, monkeypatch):
         """Test generation calls audio processor trim/pad/stitch methods."""
         generator_with_mocks.tts.generate_audio.return_value = sample_audio
 
-        # Spy on audio processor
+        # Spy on audio processor (monkeypatch restores the shared generator)
         audio_processor = generator_with_mocks.audio
-        original_stitch = audio_processor.stitch
-        stitch_calls = []
-
-        def stitch_spy(segments):
-            stitch_calls.append(len(segments))
-            return original_stitch(segments)
-
-        audio_processor.stitch = stitch_spy
+        stitch_spy = MagicMock(wraps=audio_processor.stitch)
+        monkeypatch.setattr(audio_processor, "stitch", stitch_spy)
 
         generator_with_mocks.generate(simple_script)
 
         # Should have called stitch for each segment
-        assert len(stitch_calls) == len(simple_script.segments)
+        assert stitch_spy.call_count == len(simple_script.segments)
 
-    def test_generate_calls_metadata_builder(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_calls_metadata_builder(self, generated_metadata):
         """Test generation calls MetadataBuilder to create metadata."""
-        generator_with_mocks.tts.generate_audio.return_value = sample_audio
-
-        result = generator_with_mocks.generate(simple_script)
+        _, metadata = generated_metadata
 
         # Verify metadata was created with breath cycles
-        metadata = generator_with_mocks.storage.read_json(result.metadata_path)
         assert "breath_cycles" in metadata
         assert len(metadata["breath_cycles"]) >= 0  # May have 0 if all narration-only
 
@@ -470,16 +384,15 @@ class TestStatisticsAndReporting:
         assert result.cache_hit_count == 10
         assert result.cache_miss_count == 5
 
-    def test_generate_result_total_duration_matches_segments(self, generator_with_mocks, simple_script, sample_audio):
+    def test_generate_result_total_duration_matches_segments(
+        self, generator_with_mocks, simple_script, sample_audio, wav_duration_ms
+    ):
         """Test total duration equals sum of segment durations."""
         generator_with_mocks.tts.generate_audio.return_value = sample_audio
 
         result = generator_with_mocks.generate(simple_script)
 
-        # Read back audio files and sum their durations
-        actual_total_ms = 0
-        for audio_file in result.audio_files:
-            audio = AudioSegment.from_file(audio_file)
-            actual_total_ms += len(audio)
+        # Sum audio file durations from their WAV headers
+        actual_total_ms = sum(wav_duration_ms(audio_file) for audio_file in result.audio_files)
 
         assert result.total_duration_ms == actual_total_ms
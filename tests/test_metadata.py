@@ -16,7 +16,6 @@ from voice_generation.processors.metadata import MetadataBuilder
 from voice_generation.core.models import (
     NarrationScript, Segment, BreathingPattern, AudioConfig, Exercise, VoiceConfig
 )
-from voice_generation.core.results import SegmentResult
 
 
 # ============================================================================
@@ -156,15 +155,11 @@ class TestBreathingGuidesConfiguration:
 class TestVoiceConfiguration:
     """Test voice configuration creation."""
 
-    def test_create_voices_config(self, tmp_path):
+    def test_create_voices_config(self, make_segment_result, make_exercise_dir):
         """Test creating voice configuration from segment result."""
-        audio_file = tmp_path / "test_audio.wav"
-        audio_file.touch()
+        exercise_dir = make_exercise_dir("exercise-v1")
 
-        exercise_dir = tmp_path / "exercise-v1"
-        exercise_dir.mkdir()
-
-        segment_result = SegmentResult(
+        segment_result = make_segment_result(
             segment_id="intro",
             segment_index=0,
             audio_path=exercise_dir / "intro_0.wav",
@@ -191,7 +186,7 @@ class TestVoiceConfiguration:
 class TestBreathCycleCreation:
     """Test complete breath cycle object creation."""
 
-    def test_create_breath_cycle_structured(self, tmp_path):
+    def test_create_breath_cycle_structured(self, make_segment_result, make_exercise_dir):
         """Test creating breath cycle with structured breathing."""
         segment = Segment(
             id="practice",
@@ -209,10 +204,9 @@ class TestBreathCycleCreation:
             ),
         )
 
-        exercise_dir = tmp_path / "test-exercise-v1"
-        exercise_dir.mkdir()
+        exercise_dir = make_exercise_dir("test-exercise-v1")
 
-        segment_result = SegmentResult(
+        segment_result = make_segment_result(
             segment_id="practice",
             segment_index=0,
             audio_path=exercise_dir / "practice_0.wav",
@@ -241,7 +235,7 @@ class TestBreathCycleCreation:
         assert cycle["audio_biofeedbacks"] == []
         assert cycle["commands_text"] == []
 
-    def test_create_breath_cycle_natural(self, tmp_path):
+    def test_create_breath_cycle_natural(self, make_segment_result, make_exercise_dir):
         """Test creating breath cycle with natural breathing."""
         segment = Segment(
             id="intro",
@@ -255,10 +249,9 @@ class TestBreathCycleCreation:
             ),
         )
 
-        exercise_dir = tmp_path / "test-v1"
-        exercise_dir.mkdir()
+        exercise_dir = make_exercise_dir("test-v1")
 
-        segment_result = SegmentResult(
+        segment_result = make_segment_result(
             segment_id="intro",
             segment_index=0,
             audio_path=exercise_dir / "intro_0.wav",
@@ -285,24 +278,24 @@ class TestBreathCycleCreation:
 class TestSegmentMetadata:
     """Test segment metadata aggregation."""
 
-    def test_build_segments_metadata(self, tmp_path):
+    def test_build_segments_metadata(self, make_segment_result, tmp_path):
         """Test building segment metadata from results."""
         results = [
-            SegmentResult(
+            make_segment_result(
                 segment_id="intro",
                 segment_index=0,
                 audio_path=tmp_path / "intro_0.wav",
                 duration_ms=5000,
                 fragment_count=2,
             ),
-            SegmentResult(
+            make_segment_result(
                 segment_id="intro",
                 segment_index=1,
                 audio_path=tmp_path / "intro_1.wav",
                 duration_ms=3000,
                 fragment_count=1,
             ),
-            SegmentResult(
+            make_segment_result(
                 segment_id="practice",
                 segment_index=0,
                 audio_path=tmp_path / "practice_0.wav",
@@ -327,10 +320,10 @@ class TestSegmentMetadata:
         assert len(metadata["practice"]) == 1
         assert metadata["practice"][0]["duration_ms"] == 10000
 
-    def test_build_segments_metadata_with_shortening(self, tmp_path):
+    def test_build_segments_metadata_with_shortening(self, make_segment_result, tmp_path):
         """Test segment metadata includes text shortening info."""
         results = [
-            SegmentResult(
+            make_segment_result(
                 segment_id="practice",
                 segment_index=0,
                 audio_path=tmp_path / "practice_0.wav",
@@ -358,7 +351,7 @@ class TestSegmentMetadata:
 class TestCompleteMetadataBuilding:
     """Test complete metadata building workflow."""
 
-    def test_build_metadata_complete(self, tmp_path):
+    def test_build_metadata_complete(self, make_segment_result, make_exercise_dir):
         """Test building complete metadata structure."""
         script = NarrationScript(
             exercise=Exercise(
@@ -392,18 +385,17 @@ class TestCompleteMetadataBuilding:
             voice_config=VoiceConfig(),
         )
 
-        exercise_dir = tmp_path / "test-exercise-v1"
-        exercise_dir.mkdir()
+        exercise_dir = make_exercise_dir("test-exercise-v1")
 
         segment_results = [
-            SegmentResult(
+            make_segment_result(
                 segment_id="intro",
                 segment_index=0,
                 audio_path=exercise_dir / "intro_0.wav",
                 duration_ms=5000,
                 fragment_count=1,
             ),
-            SegmentResult(
+            make_segment_result(
                 segment_id="practice",
                 segment_index=0,
                 audio_path=exercise_dir / "practice_0.wav",
@@ -428,7 +420,7 @@ class TestCompleteMetadataBuilding:
         # Check breath cycles (should have 2: intro + practice)
         assert len(metadata["breath_cycles"]) == 2
 
-    def test_build_metadata_skips_narration_only(self, tmp_path):
+    def test_build_metadata_skips_narration_only(self, make_segment_result, make_exercise_dir):
         """Test narration-only segments (no breathing) are skipped in breath_cycles."""
         script = NarrationScript(
             exercise=Exercise(
@@ -446,11 +438,10 @@ class TestCompleteMetadataBuilding:
             voice_config=VoiceConfig(),
         )
 
-        exercise_dir = tmp_path / "test-v1"
-        exercise_dir.mkdir()
+        exercise_dir = make_exercise_dir("test-v1")
 
         segment_results = [
-            SegmentResult(
+            make_segment_result(
                 segment_id="narration",
                 segment_index=0,
                 audio_path=exercise_dir / "narration_0.wav",
@@ -465,7 +456,7 @@ class TestCompleteMetadataBuilding:
         assert "narration" in metadata["segments"]
         assert len(metadata["breath_cycles"]) == 0
 
-    def test_build_metadata_missing_segment_result(self, tmp_path):
+    def test_build_metadata_missing_segment_result(self, make_exercise_dir):
         """Test metadata building handles missing segment results gracefully."""
         script = NarrationScript(
             exercise=Exercise(title="Test", id="test-v1"),
@@ -480,8 +471,7 @@ class TestCompleteMetadataBuilding:
             voice_config=VoiceConfig(),
         )
 
-        exercise_dir = tmp_path / "test-v1"
-        exercise_dir.mkdir()
+        exercise_dir = make_exercise_dir("test-v1")
 
         # No segment results provided
         segment_results = []
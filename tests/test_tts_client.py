@@ -14,6 +14,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 import io
+from concurrent.futures import ThreadPoolExecutor
 
 from pydub import AudioSegment
 import requests
@@ -82,32 +83,20 @@ class TestClientInitialization:
 class TestAudioGeneration:
     """Test audio generation with mocked API calls."""
 
-    @patch('requests.post')
-    def test_generate_audio_success(self, mock_post, sample_audio):
+    def test_generate_audio_success(self, mock_session):
         """Test successful audio generation."""
         # Mock successful API response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
-        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice")
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", session=mock_session)
         audio = client.generate_audio("Test text")
 
         assert isinstance(audio, AudioSegment)
         assert client.api_calls == 1
         assert client.total_characters == len("Test text")
-        mock_post.assert_called_once()
+        mock_session.post.assert_called_once()
 
-    @patch('requests.post')
-    def test_generate_audio_with_context(self, mock_post, sample_audio):
+    def test_generate_audio_with_context(self, mock_session):
         """Test audio generation with previous/next text context."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
-        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice")
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", session=mock_session)
         audio = client.generate_audio(
             text="Current text",
             previous_text="Previous text",
@@ -116,19 +105,19 @@ class TestAudioGeneration:
 
         assert isinstance(audio, AudioSegment)
         # Verify context was passed in request
-        call_args = mock_post.call_args
-        assert "previous_text" in str(call_args) or call_args is not None
+        payload = mock_session.post.call_args.kwargs["json"]
+        assert payload["previous_text"] == "Previous text"
+        assert payload["next_text"] == "Next text"
 
-    @patch('requests.post')
-    def test_generate_audio_api_error_raises_exception(self, mock_post):
+    def test_generate_audio_api_error_raises_exception(self, mock_session):
         """Test API error raises TTSError."""
         mock_response = Mock()
         mock_response.status_code = 500
         mock_response.text = "Internal Server Error"
         mock_response.raise_for_status.side_effect = requests.HTTPError("500 Error")
-        mock_post.return_value = mock_response
+        mock_session.post.return_value = mock_response
 
-        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", max_retries=1)
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", max_retries=1, session=mock_session)
 
         with pytest.raises(TTSError) as exc_info:
             client.generate_audio("Test text")
@@ -143,18 +132,13 @@ class TestAudioGeneration:
 class TestCaching:
     """Test audio caching functionality."""
 
-    @patch('requests.post')
-    def test_cache_miss_then_hit(self, mock_post, temp_cache_dir, sample_audio):
+    def test_cache_miss_then_hit(self, mock_session, temp_cache_dir):
         """Test cache miss followed by cache hit."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             cache_dir=temp_cache_dir,
+            session=mock_session,
         )
 
         # First call - cache miss
@@ -172,18 +156,13 @@ class TestCaching:
         # Audio should be the same
         assert len(audio1) == len(audio2)
 
-    @patch('requests.post')
-    def test_cache_different_text_separate_entries(self, mock_post, temp_cache_dir, sample_audio):
+    def test_cache_different_text_separate_entries(self, mock_session, temp_cache_dir):
         """Test different text creates separate cache entries."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             cache_dir=temp_cache_dir,
+            session=mock_session,
         )
 
         # Generate two different texts
@@ -193,18 +172,30 @@ class TestCaching:
         assert client.cache_misses == 2
         assert client.api_calls == 2
 
-    @patch('requests.post')
-    def test_no_cache_always_calls_api(self, mock_post, sample_audio):
-        """Test without cache, API is always called."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
+    def test_cache_miss_after_voice_settings_change(self, mock_session, temp_cache_dir):
+        """Test changing voice settings invalidates the memoized cache-key digest."""
+        client = ElevenLabsClient(
+            api_key="test_key",
+            voice_id="test_voice",
+            cache_dir=temp_cache_dir,
+            session=mock_session,
+        )
+
+        client.generate_audio("Test text")
+        client.stability = 0.9
+        client.generate_audio("Test text")
 
+        assert client.cache_misses == 2
+        assert client.cache_hits == 0
+        assert client.api_calls == 2
+
+    def test_no_cache_always_calls_api(self, mock_session):
+        """Test without cache, API is always called."""
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             # No cache_dir - caching disabled
+            session=mock_session,
         )
 
         # Call twice with same text
@@ -224,53 +215,58 @@ class TestCaching:
 class TestRetryLogic:
     """Test retry logic with exponential backoff."""
 
-    @patch('requests.post')
     @patch('time.sleep')  # Mock sleep to speed up tests
-    def test_retry_on_failure_then_success(self, mock_sleep, mock_post, sample_audio):
+    def test_retry_on_failure_then_success(self, mock_sleep, mock_session, mock_success_response):
         """Test retry logic: fail twice, succeed on third try."""
         # First two calls fail, third succeeds
         error_response = Mock()
         error_response.status_code = 503
         error_response.raise_for_status.side_effect = requests.HTTPError("503 Error")
 
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.content = sample_audio.export(format="mp3").read()
-
-        mock_post.side_effect = [error_response, error_response, success_response]
+        mock_session.post.side_effect = [error_response, error_response, mock_success_response]
 
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             max_retries=3,
             retry_backoff_factor=2.0,
+            session=mock_session,
         )
 
         audio = client.generate_audio("Test text")
 
         assert isinstance(audio, AudioSegment)
-        assert mock_post.call_count == 3  # 2 failures + 1 success
-        # Verify exponential backoff (1s, 2s)
+        assert mock_session.post.call_count == 3  # 2 failures + 1 success
+        # Verify exponential backoff (1s, 2s) with up to 50% jitter
         assert mock_sleep.call_count == 2
+        for attempt, call in enumerate(mock_sleep.call_args_list):
+            base_wait = 2.0 ** attempt
+            assert base_wait <= call.args[0] <= base_wait * 1.5
 
-    @patch('requests.post')
-    def test_max_retries_exceeded_raises_error(self, mock_post):
+    def test_max_retries_exceeded_raises_error(self, mock_session):
         """Test max retries exceeded raises TTSError."""
         error_response = Mock()
         error_response.status_code = 503
         error_response.raise_for_status.side_effect = requests.HTTPError("503 Error")
-        mock_post.return_value = error_response
+        mock_session.post.return_value = error_response
 
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             max_retries=2,
+            session=mock_session,
         )
 
         with pytest.raises(TTSError) as exc_info:
             client.generate_audio("Test text")
 
-        assert mock_post.call_count == 2  # max_retries
+        assert mock_session.post.call_count == 2  # max_retries
+
+    def test_retry_wait_capped(self):
+        """Test retry backoff never exceeds MAX_RETRY_WAIT_SECONDS."""
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", retry_backoff_factor=10.0)
+
+        assert client._get_retry_wait(5) == ElevenLabsClient.MAX_RETRY_WAIT_SECONDS
 
 
 # ============================================================================
@@ -281,15 +277,9 @@ class TestRetryLogic:
 class TestStatistics:
     """Test client statistics tracking."""
 
-    @patch('requests.post')
-    def test_statistics_tracking(self, mock_post, sample_audio):
+    def test_statistics_tracking(self, mock_session):
         """Test statistics are tracked correctly."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
-        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice")
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", session=mock_session)
 
         client.generate_audio("First text")
         client.generate_audio("Second longer text")
@@ -402,6 +392,55 @@ class TestAudioCache:
 
         assert cached is None  # Should be a cache miss
 
+    def test_cache_hit_served_from_memory(self, temp_cache_dir, sample_audio):
+        """Test repeated hits are served from memory without touching disk."""
+        cache = AudioCache(temp_cache_dir, ttl_days=30)
+        cache.set("Text", None, None, {}, sample_audio)
+        first = cache.get("Text", None, None, {})
+
+        # Remove the files; the decoded entry is still held in memory
+        for path in temp_cache_dir.iterdir():
+            path.unlink()
+        second = cache.get("Text", None, None, {})
+
+        assert second is first
+
+    def test_cache_memory_evicts_least_recently_used(self, temp_cache_dir, sample_audio):
+        """Test in-memory entries beyond memory_entries are evicted oldest first."""
+        cache = AudioCache(temp_cache_dir, ttl_days=30, memory_entries=1)
+        cache.set("Text 1", None, None, {}, sample_audio)
+        cache.set("Text 2", None, None, {}, sample_audio)
+        cache.get("Text 1", None, None, {})
+        cache.get("Text 2", None, None, {})
+
+        assert len(cache._memory) == 1
+        assert cache._compute_key("Text 2", None, None, {}) in cache._memory
+
+    def test_cache_concurrent_gets_keep_memory_bounded(self, temp_cache_dir, sample_audio):
+        """Test concurrent hits and evictions leave the in-memory LRU consistent."""
+        cache = AudioCache(temp_cache_dir, ttl_days=30, memory_entries=3)
+        texts = [f"Text {i}" for i in range(8)]
+        for text in texts:
+            cache.set(text, None, None, {}, sample_audio)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda text: cache.get(text, None, None, {}), texts * 10))
+
+        assert all(audio is not None for audio in results)
+        assert len(cache._memory) == 3
+
+    def test_cache_precomputed_voice_config_digest_same_key(self, temp_cache_dir, sample_audio):
+        """Test a precomputed voice config digest hits entries stored without one."""
+        cache = AudioCache(temp_cache_dir, ttl_days=30)
+        voice_config = {"voice_id": "test_voice", "stability": 0.6}
+
+        cache.set("Text", None, None, voice_config, sample_audio)
+        digest = AudioCache.digest_voice_config(voice_config)
+        cached = cache.get("Text", None, None, voice_config, voice_config_digest=digest)
+
+        assert cached is not None
+        assert len(cached) == len(sample_audio)
+
 
 # ============================================================================
 # Integration Tests
@@ -411,19 +450,14 @@ class TestAudioCache:
 class TestTTSClientIntegration:
     """Test realistic TTS client workflows."""
 
-    @patch('requests.post')
-    def test_complete_workflow_with_cache(self, mock_post, temp_cache_dir, sample_audio):
+    def test_complete_workflow_with_cache(self, mock_session, temp_cache_dir):
         """Test complete workflow: generate, cache, retrieve."""
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.content = sample_audio.export(format="mp3").read()
-        mock_post.return_value = mock_response
-
         client = ElevenLabsClient(
             api_key="test_key",
             voice_id="test_voice",
             cache_dir=temp_cache_dir,
             max_retries=3,
+            session=mock_session,
         )
 
         # Generate multiple texts
@@ -435,3 +469,51 @@ class TestTTSClientIntegration:
         assert client.api_calls == 2  # Only 2 unique texts
         assert client.cache_hits == 1  # Third call was cache hit
         assert client.cache_misses == 2
+
+    def test_generate_audio_batch(self, mock_session, temp_cache_dir):
+        """Test batch generation keeps order, dedups texts and uses the cache."""
+        client = ElevenLabsClient(
+            api_key="test_key",
+            voice_id="test_voice",
+            cache_dir=temp_cache_dir,
+            session=mock_session,
+        )
+        client.generate_audio("Text 1")
+
+        results = client.generate_audio_batch(["Text 1", "Text 2", "Text 3", "Text 2"])
+
+        assert len(results) == 4
+        assert all(isinstance(audio, AudioSegment) for audio in results)
+        assert results[1] is results[3]  # Repeated text requested once
+        assert client.api_calls == 3  # "Text 1" came from cache
+        assert client.cache_hits == 1
+        assert client.cache_misses == 3
+
+    def test_generate_audio_batch_concurrent_with_real_cache(self, mock_session, temp_cache_dir):
+        """Test concurrent batch generation fills a real AudioCache consistently."""
+        client = ElevenLabsClient(
+            api_key="test_key",
+            voice_id="test_voice",
+            cache_dir=temp_cache_dir,
+            session=mock_session,
+        )
+        client.cache.memory_entries = 4  # Force LRU evictions
+        texts = [f"Text {i}" for i in range(12)]
+
+        first = client.generate_audio_batch(texts, max_workers=6)
+        second = client.generate_audio_batch(texts, max_workers=6)
+
+        assert len(first) == len(second) == len(texts)
+        assert client.api_calls == len(texts)  # Second batch served from cache
+        assert client.cache_hits == len(texts)
+        assert len(client.cache._memory) == 4
+        assert client.cache.get_stats()["entry_count"] == len(texts)
+
+    def test_generate_audio_batch_error_propagates(self, mock_session):
+        """Test a failed request in a batch raises TTSError."""
+        error_response = Mock(status_code=400, text="Bad request")
+        mock_session.post.return_value = error_response
+        client = ElevenLabsClient(api_key="test_key", voice_id="test_voice", max_retries=1, session=mock_session)
+
+        with pytest.raises(TTSError):
+            client.generate_audio_batch(["Text 1", "Text 2"])
@@ -11,6 +11,7 @@ Test Coverage Goals:
 import pytest
 
 from voice_generation.core.validator import NarrationValidator
+from voice_generation.core.results import ValidationCode
 from voice_generation.core.models import (
     Exercise,
     AudioConfig,
@@ -21,6 +22,12 @@ from voice_generation.core.models import (
 )
 
 
+# Oversized texts shared by the length and timing tests
+_LONG_TEXT = "A" * 1200  # > 1000 chars total
+_LONG_FRAGMENT = "B" * 600  # > 500 chars in one fragment
+_LONG_NARRATION = "This is a very long narration script. " * 50  # ~2000 chars
+
+
 # ============================================================================
 # Exercise Duration Validation Tests
 # ============================================================================
@@ -60,7 +67,7 @@ class TestExerciseDurationValidation:
         result = validator.validate(script)
         assert not result.is_valid
         assert len(result.errors) > 0
-        assert any("too long" in err.lower() for err in result.errors)
+        assert ValidationCode.EXERCISE_TOO_LONG in result.error_codes
 
     def test_exercise_duration_mismatch_warning(self):
         """Test warning when specified duration doesn't match estimated duration."""
@@ -102,7 +109,7 @@ class TestSegmentValidation:
         result = validator.validate(script)
         assert not result.is_valid
         assert len(result.errors) > 0
-        assert any("duplicate" in err.lower() for err in result.errors)
+        assert ValidationCode.DUPLICATE_SEGMENT_ID in result.error_codes
 
     def test_unique_segment_ids_pass(self):
         """Test unique segment IDs pass validation."""
@@ -140,7 +147,7 @@ class TestBreathingPatternValidation:
 
         result = validator.validate(script)
         assert not result.is_valid
-        assert any("too short" in err.lower() for err in result.errors)
+        assert ValidationCode.BREATHING_TOO_SHORT in result.error_codes
 
     def test_breathing_cycle_very_long_warning(self):
         """Test breathing cycle > 60s (60000ms) raises warning."""
@@ -205,9 +212,7 @@ class TestAudioConfigValidation:
         validator = NarrationValidator()
 
         exercise = Exercise(id="test-v1", title="Test")
-        # Create text > 1000 chars
-        long_text = "A" * 1200
-        audio = AudioConfig(fragments=[long_text], max_duration_ms=100000)
+        audio = AudioConfig(fragments=[_LONG_TEXT], max_duration_ms=100000)
         segment = Segment(id="test", type="narration", audio=audio)
         voice = VoiceConfig(provider="elevenlabs")
         script = NarrationScript(exercise=exercise, segments=[segment], voice_config=voice)
@@ -222,8 +227,7 @@ class TestAudioConfigValidation:
         validator = NarrationValidator()
 
         exercise = Exercise(id="test-v1", title="Test")
-        long_fragment = "B" * 600
-        audio = AudioConfig(fragments=[long_fragment], max_duration_ms=50000)
+        audio = AudioConfig(fragments=[_LONG_FRAGMENT], max_duration_ms=50000)
         segment = Segment(id="test", type="narration", audio=audio)
         voice = VoiceConfig(provider="elevenlabs")
         script = NarrationScript(exercise=exercise, segments=[segment], voice_config=voice)
@@ -264,9 +268,8 @@ class TestTimingFeasibility:
         exercise = Exercise(id="test-v1", title="Test")
         breathing = BreathingPattern(inhale_ms=4000, exhale_ms=6000, repetitions=10)
         # Very long text that will exceed max_duration
-        long_text = "This is a very long narration script. " * 50  # ~2000 chars
         audio = AudioConfig(
-            fragments=[long_text],
+            fragments=[_LONG_NARRATION],
             max_duration_ms=3000,  # Too short for this text
             allow_shortening=True,
         )
@@ -285,9 +288,8 @@ class TestTimingFeasibility:
 
         exercise = Exercise(id="test-v1", title="Test")
         breathing = BreathingPattern(inhale_ms=4000, exhale_ms=6000, repetitions=10)
-        long_text = "This is a very long narration script. " * 50  # ~2000 chars
         audio = AudioConfig(
-            fragments=[long_text],
+            fragments=[_LONG_NARRATION],
             max_duration_ms=3000,
             allow_shortening=False,  # Shortening disabled!
         )
@@ -297,8 +299,7 @@ class TestTimingFeasibility:
 
         result = validator.validate(script)
         assert not result.is_valid
-        assert any("exceed max_duration" in err.lower() and "shortening is disabled" in err.lower()
-                   for err in result.errors)
+        assert ValidationCode.AUDIO_EXCEEDS_MAX_DURATION in result.error_codes
 
     def test_max_duration_exceeds_breathing_cycle_warning(self):
         """Test max_duration > breathing cycle duration raises warning."""
@@ -363,8 +364,7 @@ class TestValidatorIntegration:
         segment1 = Segment(id="duplicate", type="breathing_cycle", breathing=breathing1, audio=audio1)
 
         # Segment 2: Duplicate ID, long text
-        long_text = "A" * 1200
-        audio2 = AudioConfig(fragments=[long_text], max_duration_ms=50000)
+        audio2 = AudioConfig(fragments=[_LONG_TEXT], max_duration_ms=50000)
         segment2 = Segment(id="duplicate", type="narration", audio=audio2)
 
         voice = VoiceConfig(provider="elevenlabs")
@@ -374,3 +374,27 @@ class TestValidatorIntegration:
         assert not result.is_valid
         assert len(result.errors) >= 2  # Duplicate ID + breathing cycle too short
         assert len(result.warnings) >= 2  # Duration mismatch + long text
+
+    def test_fail_fast_stops_after_first_failing_segment(self):
+        """Test fail_fast skips segments after the first one with an error."""
+        validator = NarrationValidator()
+
+        exercise = Exercise(id="test-v1", title="Test")
+
+        # Segment 1: too short breathing cycle
+        breathing1 = BreathingPattern(inhale_ms=300, exhale_ms=400, repetitions=10)
+        audio1 = AudioConfig(fragments=["Test"], max_duration_ms=500)
+        segment1 = Segment(id="duplicate", type="breathing_cycle", breathing=breathing1, audio=audio1)
+
+        # Segment 2: duplicate ID (not reached)
+        audio2 = AudioConfig(fragments=["Test"], max_duration_ms=5000)
+        segment2 = Segment(id="duplicate", type="narration", audio=audio2)
+
+        voice = VoiceConfig(provider="elevenlabs")
+        script = NarrationScript(exercise=exercise, segments=[segment1, segment2], voice_config=voice)
+
+        result = validator.validate(script, fail_fast=True)
+        assert not result.is_valid
+        assert result.error_codes == {ValidationCode.BREATHING_TOO_SHORT}
+        assert len(result.errors) == 1
+        assert len(validator.validate(script).errors) == 2